@@ -0,0 +1,17 @@
+"""
+脚本公共引导模块
+统一设置项目根目录的导入路径和环境变量，各脚本通过 `from _bootstrap import PROJECT_ROOT` 使用
+"""
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# 设置UTF-8编码环境变量，并让子进程知道项目根目录
+os.environ['PYTHONIOENCODING'] = 'utf-8'
+os.environ.setdefault('TRENDING_SERVICE_ROOT', str(PROJECT_ROOT))
@@ -4,47 +4,98 @@
 当检测到401错误时，自动执行Cookie更新流程
 """
 
-import sys
+import os
 import json
 import re
-from pathlib import Path
+import logging
+import threading
+import time
 from datetime import datetime, timedelta
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from _bootstrap import PROJECT_ROOT
 
-from playwright.sync_api import sync_playwright
+# 401 检测用的预编译模式（直接作用于 bytes，避免逐行解码）
+_TS_RE = re.compile(rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_NEEDLE = '401 Client Error'.encode()
+_ZHIHU = '知乎'.encode('utf-8')
+
+# Playwright 持久化用户目录（保存知乎登录态）
+USER_DATA_DIR = PROJECT_ROOT / 'data' / 'playwright_profile' / 'zhihu'
+
+# 需要展示的关键 Cookie（按展示顺序）
+IMPORTANT_COOKIES = ('z_c0', 'q_c1', 'tgw_l7_route', '_xsrf')
+_IMPORTANT_COOKIE_SET = frozenset(IMPORTANT_COOKIES)
+
+# check_recent_401_error 结果缓存，以日志文件 (mtime_ns, size) 为 key
+_CACHE_TTL = 5
+_CACHE = {'key': None, 'val': None, 'ts': 0}
+
+
+def _tail_lines(path, n=100, block=8192):
+    """从文件末尾按块反向读取，返回最后 n 行原始字节（避免读取整个日志文件）"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        buf = bytearray()
+        read_so_far = 0
+        while read_so_far < size and buf.count(b'\n') < n + 1:
+            step = min(block, size - read_so_far)
+            read_so_far += step
+            f.seek(size - read_so_far)
+            buf[:0] = f.read(step)
+    # 只切分末尾 n+1 段，块内更早的内容保持为一段不做拆分
+    lines = buf.rsplit(b'\n', n + 1)
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines[-n:]
 
 
 def check_recent_401_error():
-    """检查最近是否有401错误"""
-    log_file = Path(__file__).parent.parent / 'data' / 'logs' / 'trending_service.log'
+    """检查最近是否有401错误（日志文件未变化时，短时间内复用上次的检查结果）"""
+    log_file = PROJECT_ROOT / 'data' / 'logs' / 'trending_service.log'
     
-    if not log_file.exists():
+    try:
+        stat = log_file.stat()
+    except FileNotFoundError:
         return False, "日志文件不存在"
     
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _CACHE['key'] == key and time.time() - _CACHE['ts'] < _CACHE_TTL:
+        return _CACHE['val']
+    
+    result = _scan_recent_401_error(log_file)
+    _CACHE.update(key=key, val=result, ts=time.time())
+    return result
+
+
+def _scan_recent_401_error(log_file):
+    """扫描日志末尾，查找最近1小时内的知乎401错误"""
     # 读取最近100行日志
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[-100:]
+        lines = _tail_lines(log_file, n=100)
     except Exception as e:
         return False, f"读取日志失败: {e}"
     
     # 检查是否有401错误
     for line in lines:
-        if '401 Client Error' in line and '知乎' in line:
+        if _NEEDLE in line and _ZHIHU in line:
             # 提取时间
-            time_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
+            time_match = _TS_RE.match(line)
             if time_match:
-                error_time = datetime.strptime(time_match.group(1), '%Y-%m-%d %H:%M:%S')
+                error_time = datetime.strptime(time_match.group(1).decode('ascii'), '%Y-%m-%d %H:%M:%S')
                 # 如果是最近1小时的错误
                 if datetime.now() - error_time < timedelta(hours=1):
-                    return True, f"发现最近的401错误: {line.strip()}"
+                    text = line.decode('utf-8', errors='replace').strip()
+                    return True, f"发现最近的401错误: {text}"
     
     return False, "未发现最近的401错误"
 
 
 def get_zhihu_cookie_auto():
     """自动获取知乎Cookie（无需用户按回车）"""
+    # 仅在需要登录时才加载 Playwright，常规检测路径无需承担其导入开销
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+
     print("=" * 60)
     print("知乎 Cookie 自动更新工具")
     print("=" * 60)
@@ -55,50 +106,54 @@ def get_zhihu_cookie_auto():
     print("=" * 60)
     print()
 
-    cookies_file = Path(__file__).parent.parent / 'data' / 'zhihu_cookies.json'
+    cookies_file = PROJECT_ROOT / 'data' / 'zhihu_cookies.json'
 
     with sync_playwright() as p:
         # 启动浏览器（非无头模式，方便用户操作）
-        browser = p.chromium.launch(headless=False)
-
-        # 创建上下文
-        context = browser.new_context(
+        # 使用持久化用户目录，保留登录态，后续刷新 Cookie 通常无需重新登录
+        USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=str(USER_DATA_DIR),
+            headless=False,
             viewport={'width': 1920, 'height': 1080},
             locale='zh-CN',
+            args=['--disable-blink-features=AutomationControlled'],
         )
 
-        # 创建页面
-        page = context.new_page()
+        # 持久化上下文启动时自带一个页面，直接复用
+        page = context.pages[0] if context.pages else context.new_page()
 
         # 访问知乎
         print("🌐 正在打开知乎...")
-        page.goto('https://www.zhihu.com', wait_until='networkidle')
+        page.goto('https://www.zhihu.com', wait_until='domcontentloaded')
 
         # 等待用户登录（通过检测URL变化或特定元素）
         print("\n⏳ 请在浏览器中登录知乎...")
         print("登录成功后，脚本会自动检测并保存Cookie")
         
-        # 等待登录成功（最多等待5分钟）
-        login_success = False
-        for i in range(300):  # 300秒 = 5分钟
-            try:
-                # 检查是否已登录（通过查找用户头像或用户名元素）
-                user_element = page.query_selector('.AppHeader-profileEntry, .ProfileCard, [data-za-detail-view-path-module="UserProfile"]')
-                if user_element:
-                    login_success = True
-                    print("\n✅ 检测到登录成功！")
-                    break
-            except:
-                pass
-            
-            # 每秒检查一次
-            import time
-            time.sleep(1)
-            
-            # 显示进度
-            if i % 30 == 0 and i > 0:
-                print(f"  已等待 {i} 秒，请完成登录...")
-        
+        # 等待登录成功（最多等待5分钟），由浏览器端监听 DOM 变化，无需轮询
+        stop_progress = threading.Event()
+
+        def _report_progress():
+            waited = 0
+            while not stop_progress.wait(30):
+                waited += 30
+                print(f"  已等待 {waited} 秒，请完成登录...")
+
+        threading.Thread(target=_report_progress, daemon=True).start()
+        try:
+            # 检查是否已登录（通过查找用户头像或用户名元素）
+            page.wait_for_selector(
+                '.AppHeader-profileEntry, .ProfileCard, [data-za-detail-view-path-module="UserProfile"]',
+                timeout=300_000
+            )
+            login_success = True
+            print("\n✅ 检测到登录成功！")
+        except PlaywrightTimeoutError:
+            login_success = False
+        finally:
+            stop_progress.set()
+
         if not login_success:
             print("\n⚠️ 等待超时，请手动按回车键保存当前Cookie...")
             input()
@@ -109,20 +164,21 @@ def get_zhihu_cookie_auto():
         # 保存 Cookie
         cookies_file.parent.mkdir(parents=True, exist_ok=True)
         with open(cookies_file, 'w', encoding='utf-8') as f:
-            json.dump(cookies, f, ensure_ascii=False, indent=2)
+            json.dump(cookies, f, ensure_ascii=False, separators=(',', ':'))
 
         print(f"\n✅ Cookie 已保存到: {cookies_file}")
         print(f"📊 共 {len(cookies)} 个 Cookie")
 
         # 显示关键 Cookie
-        important_cookies = ['z_c0', 'q_c1', 'tgw_l7_route', '_xsrf']
+        found = {c['name']: c['value'] for c in cookies if c['name'] in _IMPORTANT_COOKIE_SET}
         print("\n关键 Cookie:")
-        for cookie in cookies:
-            if cookie['name'] in important_cookies:
-                print(f"  - {cookie['name']}: {cookie['value'][:30]}...")
+        for name in IMPORTANT_COOKIES:
+            value = found.get(name)
+            if value:
+                print(f"  - {name}: {value[:30]}...")
 
         # 关闭浏览器
-        browser.close()
+        context.close()
 
     print("\n" + "=" * 60)
     print("Cookie 更新完成!")
@@ -130,15 +186,17 @@ def get_zhihu_cookie_auto():
     return True
 
 
-def test_zhihu_fetch():
+def test_zhihu_fetch(verbose: bool = False):
     """测试知乎热榜获取"""
     print("\n🧪 正在测试知乎热榜获取...")
     
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from src.fetchers import ZhihuHotFetcher
-    from src.utils import get_logger
+    from src.fetchers.zhihu_hot import ZhihuHotFetcher
     
-    logger = get_logger('test_zhihu')
+    if verbose:
+        from src.utils import setup_logger
+        logger = setup_logger('test_zhihu')
+    else:
+        logger = logging.getLogger('test_zhihu')
     fetcher = ZhihuHotFetcher(logger=logger)
     items = fetcher.fetch()
     
@@ -155,6 +213,12 @@ def test_zhihu_fetch():
 
 def main():
     """主函数"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='检测知乎401错误并自动更新Cookie')
+    parser.add_argument('--verbose', action='store_true', help='输出知乎获取器的详细日志')
+    args = parser.parse_args()
+
     print("🔍 检查知乎Cookie状态...")
     
     # 检查是否有401错误
@@ -167,13 +231,13 @@ def main():
         # 获取新Cookie
         if get_zhihu_cookie_auto():
             # 测试获取
-            test_zhihu_fetch()
+            test_zhihu_fetch(verbose=args.verbose)
         else:
             print("❌ Cookie更新失败")
     else:
         print(f"✅ {message}")
         print("\n🧪 直接测试知乎热榜获取...")
-        test_zhihu_fetch()
+        test_zhihu_fetch(verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -5,24 +5,80 @@
 
 import sys
 import os
+import json
 import webbrowser
 import requests
 import socket
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# 添加src目录到Python路径
-project_root = Path(__file__).parent.parent
-src_dir = project_root / 'src'
-sys.path.insert(0, str(src_dir))
+from _bootstrap import PROJECT_ROOT
+from src.config import SERVER, BROWSER
 
-from config import SERVER, BROWSER
+# 复用连接池（keep-alive），HTTP 与报告页检查共用同一主机的连接
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+
+_LOCAL_HOSTS = ('127.0.0.1', 'localhost', '0.0.0.0', '::1')
+
+
+def _check_port(host: str, port: int) -> dict:
+    """检查端口是否开放（本机地址使用更短的超时）"""
+    checks = {}
+    timeout = 0.25 if host in _LOCAL_HOSTS else 2
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            checks['port'] = True
+    except OSError as e:
+        checks['port'] = False
+        checks['port_error'] = f"端口 {port} 未开放 ({e})"
+    return checks
+
+
+def _head(url: str) -> requests.Response:
+    """发送 HEAD 请求（不下载响应体），服务端不支持 HEAD 时回退为流式 GET"""
+    response = _SESSION.head(url, timeout=5, allow_redirects=True)
+    if response.status_code == 405:
+        response = _SESSION.get(url, timeout=5, stream=True)
+        response.close()
+    return response
+
+
+def _check_http(url: str) -> dict:
+    """检查HTTP服务"""
+    checks = {}
+    try:
+        response = _head(url)
+        checks['http'] = response.status_code == 200
+        checks['http_status'] = response.status_code
+    except Exception as e:
+        checks['http'] = False
+        checks['http_error'] = str(e)
+    return checks
+
+
+def _check_report(report_url: str) -> dict:
+    """检查报告页面"""
+    checks = {}
+    try:
+        response = _head(report_url)
+        checks['report'] = response.status_code == 200
+        checks['report_status'] = response.status_code
+        checks['report_content'] = 'html' in response.headers.get('content-type', '')
+    except Exception as e:
+        checks['report'] = False
+        checks['report_error'] = str(e)
+    return checks
 
 
 def check_service_status(host: str = None, port: int = None) -> dict:
     """
     检查服务状态
 
+    端口检查失败时直接返回；端口正常时 HTTP 服务和报告页面两项检查并发执行
+
     Args:
         host: 服务器地址
         port: 服务器端口
@@ -43,38 +99,23 @@ def check_service_status(host: str = None, port: int = None) -> dict:
         'checks': {}
     }
 
-    # 检查端口是否开放
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((host, port))
-        port_open = result == 0
-        status['checks']['port'] = port_open
-        if not port_open:
-            status['checks']['port_error'] = f"端口 {port} 未开放 (错误码: {result})"
-        sock.close()
-    except Exception as e:
-        status['checks']['port'] = False
-        status['checks']['port_error'] = str(e)
-
-    # 检查HTTP服务
-    try:
-        response = requests.get(url, timeout=5)
-        status['checks']['http'] = response.status_code == 200
-        status['checks']['http_status'] = response.status_code
-    except Exception as e:
+    # 先检查端口，端口未开放时 HTTP 检查必然失败，直接返回
+    status['checks'].update(_check_port(host, port))
+    if not status['checks']['port']:
         status['checks']['http'] = False
-        status['checks']['http_error'] = str(e)
-
-    # 检查报告页面
-    try:
-        response = requests.get(report_url, timeout=5)
-        status['checks']['report'] = response.status_code == 200
-        status['checks']['report_status'] = response.status_code
-        status['checks']['report_content'] = 'html' in response.headers.get('content-type', '')
-    except Exception as e:
         status['checks']['report'] = False
-        status['checks']['report_error'] = str(e)
+        return status
+
+    # 端口正常时并发检查 HTTP 服务和报告页面
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_check_http, url),
+            executor.submit(_check_report, report_url),
+        ]
+
+    # 按提交顺序合并结果，保证输出顺序稳定
+    for future in futures:
+        status['checks'].update(future.result())
 
     # 综合判断服务是否运行
     status['running'] = (
@@ -156,7 +197,7 @@ def check_and_preview(host: str = None, port: int = None, auto_open: bool = True
             print(f"❌ 打开浏览器失败: {e}")
     else:
         print("\n⚠️  服务未正常运行，无法打开浏览器预览")
-        print(f"💡 提示: 请先启动服务: python {project_root}/src/main.py")
+        print(f"💡 提示: 请先启动服务: python {PROJECT_ROOT}/src/main.py")
 
 
 def main():
@@ -167,9 +208,15 @@ def main():
     parser.add_argument('--host', default=SERVER['host'], help='服务器地址')
     parser.add_argument('--port', type=int, default=SERVER['port'], help='服务器端口')
     parser.add_argument('--no-open', action='store_true', help='不自动打开浏览器')
+    parser.add_argument('--json', action='store_true', help='以单行 JSON 输出检查结果（供监控脚本调用），退出码表示服务是否正常')
 
     args = parser.parse_args()
 
+    if args.json:
+        status = check_service_status(args.host, args.port)
+        sys.stdout.write(json.dumps(status, ensure_ascii=False, default=str) + '\n')
+        sys.exit(0 if status['running'] else 1)
+
     check_and_preview(
         host=args.host,
         port=args.port,
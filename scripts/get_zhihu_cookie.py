@@ -5,14 +5,19 @@
 使用 Playwright 打开浏览器，让用户手动登录后自动保存 Cookie
 """
 
-import sys
 import json
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from _bootstrap import PROJECT_ROOT
 
 from playwright.sync_api import sync_playwright
 
+# Playwright 持久化用户目录（保存知乎登录态）
+USER_DATA_DIR = PROJECT_ROOT / 'data' / 'playwright_profile' / 'zhihu'
+
+# 需要展示的关键 Cookie（按展示顺序）
+IMPORTANT_COOKIES = ('z_c0', 'q_c1', 'tgw_l7_route', '_xsrf')
+_IMPORTANT_COOKIE_SET = frozenset(IMPORTANT_COOKIES)
+
 
 def get_zhihu_cookie():
     """获取知乎 Cookie"""
@@ -30,24 +35,26 @@ def get_zhihu_cookie():
 
     input("按回车键开始...")
 
-    cookies_file = Path(__file__).parent.parent / 'data' / 'zhihu_cookies.json'
+    cookies_file = PROJECT_ROOT / 'data' / 'zhihu_cookies.json'
 
     with sync_playwright() as p:
         # 启动浏览器（非无头模式，方便用户操作）
-        browser = p.chromium.launch(headless=False)
-
-        # 创建上下文
-        context = browser.new_context(
+        # 使用持久化用户目录，保留登录态，后续刷新 Cookie 通常无需重新登录
+        USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=str(USER_DATA_DIR),
+            headless=False,
             viewport={'width': 1920, 'height': 1080},
             locale='zh-CN',
+            args=['--disable-blink-features=AutomationControlled'],
         )
 
-        # 创建页面
-        page = context.new_page()
+        # 持久化上下文启动时自带一个页面，直接复用
+        page = context.pages[0] if context.pages else context.new_page()
 
         # 访问知乎
         print("🌐 正在打开知乎...")
-        page.goto('https://www.zhihu.com', wait_until='networkidle')
+        page.goto('https://www.zhihu.com', wait_until='domcontentloaded')
 
         # 等待用户登录
         print("\n⏳ 请在浏览器中登录知乎...")
@@ -60,20 +67,21 @@ def get_zhihu_cookie():
         # 保存 Cookie
         cookies_file.parent.mkdir(parents=True, exist_ok=True)
         with open(cookies_file, 'w', encoding='utf-8') as f:
-            json.dump(cookies, f, ensure_ascii=False, indent=2)
+            json.dump(cookies, f, ensure_ascii=False, separators=(',', ':'))
 
         print(f"\n✅ Cookie 已保存到: {cookies_file}")
         print(f"📊 共 {len(cookies)} 个 Cookie")
 
         # 显示关键 Cookie
-        important_cookies = ['z_c0', 'q_c1', 'tgw_l7_route', '_xsrf']
+        found = {c['name']: c['value'] for c in cookies if c['name'] in _IMPORTANT_COOKIE_SET}
         print("\n关键 Cookie:")
-        for cookie in cookies:
-            if cookie['name'] in important_cookies:
-                print(f"  - {cookie['name']}: {cookie['value'][:30]}...")
+        for name in IMPORTANT_COOKIES:
+            value = found.get(name)
+            if value:
+                print(f"  - {name}: {value[:30]}...")
 
         # 关闭浏览器
-        browser.close()
+        context.close()
 
     print("\n" + "=" * 60)
     print("Cookie 获取完成!")
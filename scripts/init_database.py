@@ -4,12 +4,9 @@
 """
 
 import sys
-from pathlib import Path
-
-# 添加项目根目录到 Python 路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import sqlite3
 
+import _bootstrap  # noqa: F401  设置项目根目录导入路径
 from src.config import DATABASE
 from src.db import TrendingDAO
 
@@ -40,7 +37,21 @@ def init_database():
     except Exception as e:
         print(f'❌ 数据库初始化失败: {e}')
         return False
-    
+
+    # 启用 WAL 日志模式（持久化到数据库文件，后续所有连接都生效），减少写入时的 fsync 次数
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+            conn.executescript(
+                'PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;'
+            )
+        finally:
+            conn.close()
+        print(f'✅ 日志模式: {journal_mode}')
+    except sqlite3.Error as e:
+        print(f'⚠️  设置数据库 PRAGMA 失败: {e}')
+
     # 验证数据库文件
     if db_path.exists():
         file_size = db_path.stat().st_size
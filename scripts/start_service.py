@@ -11,13 +11,9 @@ import socket
 from pathlib import Path
 from datetime import datetime
 
-# 设置UTF-8编码环境变量
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+import psutil
 
-# 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent.resolve()
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+from _bootstrap import PROJECT_ROOT
 
 # 导入配置
 from src.config import SERVER, LOGGING
@@ -111,7 +107,7 @@ def start_service_background():
     # 获取日志记录器
     logger = get_logger()
 
-    pid_file = project_root / 'trending_service.pid'
+    pid_file = PROJECT_ROOT / 'trending_service.pid'
 
     logger.info("=" * 60)
     logger.info("🚀 开始启动 Trending Service...")
@@ -122,12 +118,15 @@ def start_service_background():
         try:
             with open(pid_file, 'r') as f:
                 pid = int(f.read().strip())
-            # 检查进程是否存在 (Windows)
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            handle = kernel32.OpenProcess(1, False, pid)
-            if handle != 0:
-                kernel32.CloseHandle(handle)
+            # 检查进程是否存在（跨平台；无权限访问的进程视为存活）
+            try:
+                proc = psutil.Process(pid)
+                alive = proc.is_running() and proc.name().lower().startswith('python')
+            except psutil.NoSuchProcess:
+                alive = False
+            except psutil.AccessDenied:
+                alive = True
+            if alive:
                 # 检查端口是否开放
                 if check_port_open(SERVER['host'], SERVER['port']):
                     msg = f"⚠️  服务已在运行中 (PID: {pid})"
@@ -160,19 +159,19 @@ def start_service_background():
         logger.info(f"🐍 使用默认 Python: {python_exe}")
 
     # 启动脚本路径
-    main_script = project_root / 'src' / 'main.py'
+    main_script = PROJECT_ROOT / 'src' / 'main.py'
 
     # 设置环境变量，确保子进程知道项目根目录
     env = os.environ.copy()
-    env['TRENDING_SERVICE_ROOT'] = str(project_root)
+    env['TRENDING_SERVICE_ROOT'] = str(PROJECT_ROOT)
 
     # 使用相对路径显示
     try:
-        python_exe_rel = Path(python_exe).relative_to(project_root)
+        python_exe_rel = Path(python_exe).relative_to(PROJECT_ROOT)
     except ValueError:
         python_exe_rel = python_exe
     try:
-        main_script_rel = main_script.relative_to(project_root)
+        main_script_rel = main_script.relative_to(PROJECT_ROOT)
     except ValueError:
         main_script_rel = main_script
 
@@ -180,9 +179,15 @@ def start_service_background():
     logger.info(f"📜 启动脚本: {main_script_rel}")
     logger.info(f"🌐 服务地址: http://{SERVER['host']}:{SERVER['port']}")
 
-    # 后台启动进程
-    startupinfo = subprocess.STARTUPINFO()
-    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    # 后台启动进程（Windows 下使用独立进程组并隐藏窗口，其他平台使用新会话）
+    popen_kwargs = {}
+    if os.name == 'nt':
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        popen_kwargs['startupinfo'] = startupinfo
+        popen_kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        popen_kwargs['start_new_session'] = True
 
     try:
         # 使用 DETACHED_PROCESS 让子进程独立运行
@@ -194,16 +199,20 @@ def start_service_background():
 
         process = subprocess.Popen(
             [python_exe, str(main_script)],
-            cwd=str(project_root),
+            cwd=str(PROJECT_ROOT),
             env=env,
-            startupinfo=startupinfo,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            **popen_kwargs
         )
 
         logger.info(f"📦 子进程已创建 (PID: {process.pid})")
 
+        # 由父进程原子写入PID文件，避免停止脚本在子进程写入前读到空文件
+        tmp_pid_file = pid_file.with_suffix('.pid.tmp')
+        tmp_pid_file.write_text(str(process.pid))
+        os.replace(tmp_pid_file, pid_file)
+
         # 等待服务启动
         success, message = wait_for_service(SERVER['host'], SERVER['port'], process.pid)
 
@@ -227,14 +236,9 @@ def start_service_background():
 
             # 尝试终止进程
             try:
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                handle = kernel32.OpenProcess(1, False, process.pid)
-                if handle != 0:
-                    kernel32.TerminateProcess(handle, 1)
-                    kernel32.CloseHandle(handle)
-                    logger.info(f"已终止进程 {process.pid}")
-            except:
+                psutil.Process(process.pid).terminate()
+                logger.info(f"已终止进程 {process.pid}")
+            except psutil.Error:
                 pass
 
             raise RuntimeError(message)
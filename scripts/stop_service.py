@@ -3,20 +3,17 @@
 停止 Trending Service
 """
 
-import sys
 import os
-import signal
-import subprocess
+import time
 from pathlib import Path
 from datetime import datetime
 
-# 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent.resolve()
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+import psutil
+
+from _bootstrap import PROJECT_ROOT
 
 # 导入日志配置
-from src.config import LOGGING
+from src.config import LOGGING, SERVER
 
 
 def get_logger():
@@ -45,29 +42,62 @@ def find_service_processes():
     """查找 Trending Service 相关的进程"""
     processes = []
     try:
-        # 使用 tasklist 查找 Python 进程
-        result = subprocess.run(
-            ['tasklist', '/FI', 'IMAGENAME eq python.exe', '/FO', 'CSV'],
-            capture_output=True,
-            text=True
-        )
-        
-        # 解析输出
-        for line in result.stdout.strip().split('\n')[1:]:  # 跳过标题行
-            if line.strip():
-                parts = line.strip().strip('"').split('","')
-                if len(parts) >= 2:
-                    try:
-                        pid = int(parts[1])
-                        processes.append(pid)
-                    except ValueError:
-                        pass
+        for p in psutil.process_iter(['name']):
+            name = (p.info['name'] or '').lower()
+            if name in ('python.exe', 'python', 'python3'):
+                processes.append(p.pid)
     except Exception as e:
         print(f"查找进程时出错: {e}")
     
     return processes
 
 
+def find_listening_pids(port: int) -> set:
+    """查找监听指定端口的进程ID"""
+    return {
+        c.pid for c in psutil.net_connections(kind='inet')
+        if c.laddr and c.laddr.port == port and c.status == psutil.CONN_LISTEN and c.pid
+    }
+
+
+def terminate_process(pid: int, timeout: float = 3, stop_file: Path = None,
+                      graceful_timeout: float = 10):
+    """终止进程并等待其退出，超时后强制结束
+
+    Windows 上服务以 DETACHED_PROCESS 启动、没有控制台，无法投递 CTRL_BREAK_EVENT；
+    此时写入停止请求文件（服务主循环每秒检查一次），让服务执行 stop() 正常收尾，
+    超时未退出再强制终止。其他平台发送 SIGTERM。
+    """
+    proc = psutil.Process(pid)
+    if os.name == 'nt' and stop_file is not None:
+        stop_file.write_text(str(pid))
+        try:
+            proc.wait(timeout=graceful_timeout)
+            return
+        except psutil.TimeoutExpired:
+            pass
+        finally:
+            if stop_file.exists():
+                stop_file.unlink()
+    proc.terminate()
+    try:
+        proc.wait(timeout=timeout)
+    except psutil.TimeoutExpired:
+        proc.kill()
+        proc.wait(timeout=timeout)
+
+
+def read_pid_file(pid_file: Path, retries: int = 5, interval: float = 0.05) -> int:
+    """读取PID文件，遇到正在写入的空文件时短暂重试"""
+    for attempt in range(retries):
+        try:
+            return int(pid_file.read_text().strip())
+        except ValueError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(interval)
+
+
 def stop_service():
     """停止服务"""
     # 获取日志记录器
@@ -77,13 +107,12 @@ def stop_service():
     logger.info("🛑 停止 Trending Service...")
 
     # 尝试读取PID文件
-    pid_file = project_root / 'trending_service.pid'
+    pid_file = PROJECT_ROOT / 'trending_service.pid'
     pid = None
 
     if pid_file.exists():
         try:
-            with open(pid_file, 'r') as f:
-                pid = int(f.read().strip())
+            pid = read_pid_file(pid_file)
             print(f"📄 从PID文件读取到进程ID: {pid}")
             logger.info(f"📄 从PID文件读取到进程ID: {pid}")
         except (ValueError, IOError) as e:
@@ -97,9 +126,7 @@ def stop_service():
     # 如果找到PID，尝试停止该进程
     if pid:
         try:
-            # Windows 上使用 taskkill 停止进程
-            subprocess.run(['taskkill', '/F', '/PID', str(pid)], 
-                         capture_output=True, check=True)
+            terminate_process(pid, stop_file=pid_file.with_suffix('.stop'))
             print(f"✅ 已停止进程 {pid}")
             logger.info(f"✅ 已停止进程 {pid}")
             
@@ -110,7 +137,7 @@ def stop_service():
                 logger.info("✅ PID文件已删除")
             logger.info("🎯 Trending Service 停止完成")
             return
-        except subprocess.CalledProcessError:
+        except psutil.NoSuchProcess:
             print(f"⚠️  进程 {pid} 不存在或无法停止")
             logger.warning(f"⚠️  进程 {pid} 不存在或无法停止")
         except Exception as e:
@@ -121,38 +148,22 @@ def stop_service():
     print("🔍 尝试查找 Trending Service 进程...")
     logger.info("🔍 尝试查找 Trending Service 进程...")
     
-    # 查找占用端口 8888 的进程（修正端口号为配置中的端口）
+    # 查找占用服务端口的进程
+    port = SERVER['port']
     try:
-        result = subprocess.run(
-            ['netstat', '-ano', '|', 'findstr', ':8888'],
-            capture_output=True,
-            text=True,
-            shell=True
-        )
-        
-        pids_to_stop = set()
-        for line in result.stdout.strip().split('\n'):
-            if 'LISTENING' in line:
-                parts = line.strip().split()
-                if parts:
-                    try:
-                        listening_pid = int(parts[-1])
-                        pids_to_stop.add(listening_pid)
-                    except ValueError:
-                        pass
+        pids_to_stop = find_listening_pids(port)
         
         if pids_to_stop:
             for p in pids_to_stop:
                 try:
-                    subprocess.run(['taskkill', '/F', '/PID', str(p)], 
-                                 capture_output=True, check=True)
-                    print(f"✅ 已停止占用端口8888的进程 {p}")
-                    logger.info(f"✅ 已停止占用端口8888的进程 {p}")
+                    terminate_process(p)
+                    print(f"✅ 已停止占用端口{port}的进程 {p}")
+                    logger.info(f"✅ 已停止占用端口{port}的进程 {p}")
                 except Exception as e:
                     logger.warning(f"停止进程 {p} 时出错: {e}")
         else:
-            print("⚠️  未找到占用端口8888的进程")
-            logger.warning("⚠️  未找到占用端口8888的进程")
+            print(f"⚠️  未找到占用端口{port}的进程")
+            logger.warning(f"⚠️  未找到占用端口{port}的进程")
             
     except Exception as e:
         print(f"查找端口占用时出错: {e}")
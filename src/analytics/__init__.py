@@ -12,10 +12,10 @@ def extract_keywords_for_items(items, top_k=5):
     return _extract(items, top_k=top_k)
 
 
-def cluster_items_by_source(items, n_clusters=5):
+def cluster_items_by_source(items, n_clusters=5, incremental=False):
     """延迟导入并执行话题聚类"""
     from .clustering import cluster_items_by_source as _cluster
-    return _cluster(items, n_clusters=n_clusters)
+    return _cluster(items, n_clusters=n_clusters, incremental=incremental)
 
 
 def generate_trend_chart_data(dao, days=7):
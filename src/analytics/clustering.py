@@ -3,12 +3,21 @@
 使用 K-Means 对热点数据进行聚类
 """
 
-from sklearn.cluster import KMeans
-from sklearn.feature_extraction.text import TfidfVectorizer
-from typing import List, Dict, Optional, TYPE_CHECKING
-from dataclasses import dataclass, field
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import (
+    ENGLISH_STOP_WORDS, TfidfVectorizer, HashingVectorizer, TfidfTransformer
+)
+from sklearn.preprocessing import normalize
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
 
+import numpy as np
+import scipy.sparse as sp
+
 if TYPE_CHECKING:
     from src.fetchers import TrendingItem
 
@@ -25,31 +34,144 @@ class Topic:
     total_heat: float = 0.0  # 话题总热度
     
     def __post_init__(self):
-        self.item_count = len(self.items)
-        self.total_heat = sum(item.hot_score or 0 for item in self.items)
+        # 调用方已给出数量与总热度时不再重复计算
+        if not self.item_count:
+            self.item_count = len(self.items)
+        if not self.total_heat:
+            self.total_heat = sum(item.hot_score or 0 for item in self.items)
+
+
+# 话题关键词过滤用的英文停用词
+_EN_STOP = frozenset({
+    'hn', 'show', 'ask', 'tell', 'new', 'use', 'using', 'used',
+    'build', 'building', 'built', 'make', 'making', 'made',
+    'create', 'creating', 'created', 'write', 'writing', 'written',
+    'time', 'year', 'day', 'way', 'work', 'worked', 'working',
+    'run', 'running', 'ran', 'start', 'started', 'starting',
+    'get', 'getting', 'got', 'use', 'using', 'used',
+    'open', 'source', 'github', 'project', 'tool', 'app',
+    'web', 'site', 'online', 'free', 'version', 'update',
+    'release', 'launch', 'announced', 'available', 'based',
+    'simple', 'easy', 'fast', 'quick', 'better', 'best',
+    'how', 'what', 'why', 'when', 'where', 'who', 'which',
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all',
+})
+
+# 话题关键词过滤用的中文停用词
+_ZH_STOP = frozenset({
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人',
+    '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去',
+    '你', '会', '着', '没有', '看', '好', '自己', '这', '那',
+    '这些', '那些', '这个', '那个', '之', '与', '及', '等',
+    '可以', '需要', '进行', '通过', '使用', '基于', '实现',
+    '方法', '系统', '技术', '应用', '研究', '分析', '介绍',
+    '分享', '讨论', '问题', '解决方案', '建议', '推荐',
+})
+
+# 纯标点（不含任何字母、数字或汉字）
+_PUNCT_RE = re.compile(r'^[^\w\u4e00-\u9fff]+$')
+
+# 话题命名用的简单分词：提取中英文单词
+_TITLE_TOKEN_RE = re.compile(r'[\u4e00-\u9fff]{2,}|[a-zA-Z]{3,}')
+
+# 小语料快速聚类使用的分词模式（与 TF-IDF 的 token_pattern 一致）
+_WORD_RE = re.compile(r'(?u)\b\w+\b')
+
+# 按词集合 / 词频处理时剔除的停用词（与 TF-IDF 路径的 stop_words='english' 对齐）
+_TOKEN_STOP = ENGLISH_STOP_WORDS | _EN_STOP | _ZH_STOP
+
+
+def _content_tokens(text: str) -> List[str]:
+    """分词并去除停用词（小语料聚类与哈希向量路径按词频取关键词时使用）"""
+    return [t for t in _WORD_RE.findall(text.lower()) if t not in _TOKEN_STOP]
+
+
+def _build_vectorizer(max_features: int = 1000) -> TfidfVectorizer:
+    """创建话题聚类使用的 TF-IDF 向量化器"""
+    return TfidfVectorizer(
+        max_features=max_features,
+        stop_words='english',
+        ngram_range=(1, 2),
+        min_df=1,
+        max_df=0.8,
+        token_pattern=r'(?u)\b\w+\b',  # 支持中文分词
+        dtype=np.float32  # 聚类无需双精度，float32 可减半距离计算的内存带宽
+    )
+
+
+def _build_hashing_vectorizer(n_features: int = 1000) -> HashingVectorizer:
+    """创建哈希向量化器（无需构建词表，词频交由 TfidfTransformer 加权）"""
+    return HashingVectorizer(
+        n_features=n_features,
+        stop_words='english',
+        ngram_range=(1, 2),
+        alternate_sign=False,
+        norm=None,
+        token_pattern=r'(?u)\b\w+\b',
+        dtype=np.float32
+    )
+
+
+def _item_texts(items: List) -> List[str]:
+    """批量拼接数据项的标题与描述"""
+    return [f"{it.title} {it.description}" if it.description else it.title for it in items]
+
+
+def _item_key(item) -> str:
+    """数据项的稳定标识（用于增量聚类判断是否为新增数据）"""
+    return item.url or item.title
+
+
+def _hot_scores(items: List) -> np.ndarray:
+    """将数据项热度转为数组（缺失热度按 0 计）"""
+    return np.fromiter((item.hot_score or 0 for item in items), dtype=np.float64, count=len(items))
+
+
+def _single_topic(items: List, source: Optional[str] = None, max_len: int = 30) -> Topic:
+    """将全部数据项作为单个话题"""
+    title = items[0].title
+    return Topic(
+        id=0,
+        name=title[:max_len] + '...' if len(title) > max_len else title,
+        keywords=[],
+        items=items,
+        source=source if source is not None else items[0].source
+    )
 
 
 class TopicCluster:
     """话题聚类器"""
     
-    def __init__(self, n_clusters: int = 5, max_features: int = 1000):
+    # 数据量达到该阈值时改用 MiniBatchKMeans
+    MINI_BATCH_THRESHOLD = 50
+    # 数据量不超过该阈值时跳过 TF-IDF 与 K-Means，改用 Jaccard 相似度贪心合并
+    TINY_THRESHOLD = 8
+    # 小语料合并时的 Jaccard 相似度阈值
+    TINY_MERGE_SIMILARITY = 0.3
+
+    def __init__(self, n_clusters: int = 5, max_features: int = 1000, use_hashing: bool = False):
         """
         初始化话题聚类器
         
         Args:
             n_clusters: 聚类数量
-            max_features: TF-IDF 最大特征数
+            max_features: TF-IDF 最大特征数（哈希模式下为哈希空间维度）
+            use_hashing: 使用 HashingVectorizer 跳过词表构建，关键词改由簇内高频词生成
         """
         self.n_clusters = n_clusters
         self.max_features = max_features
-        self.vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            stop_words='english',
-            ngram_range=(1, 2),
-            min_df=1,
-            max_df=0.8,
-            token_pattern=r'(?u)\b\w+\b'  # 支持中文分词
-        )
+        self.use_hashing = use_hashing
+        if use_hashing:
+            self.vectorizer = _build_hashing_vectorizer(max_features)
+        else:
+            self.vectorizer = _build_vectorizer(max_features)
+        
+        # 增量聚类状态（见 update / cluster_incremental）
+        self._hasher = None
+        self._df = np.zeros(max_features, dtype=np.int64)  # 各哈希特征的累计文档频率
+        self._n_docs = 0
+        self._model = None
+        self._rows = {}  # 数据项标识 -> 哈希词频行
     
     def cluster(self, items: List) -> List[Topic]:
         """
@@ -64,142 +186,325 @@ class TopicCluster:
         if not items:
             return []
         
-        # 如果数据量小于聚类数，调整聚类数
-        if len(items) < self.n_clusters:
-            self.n_clusters = max(2, len(items) // 2) if len(items) > 2 else 1
+        if len(items) <= self.TINY_THRESHOLD:
+            return self._cluster_tiny(items)
         
         # 准备文本数据
-        texts = []
-        for item in items:
-            text = item.title
-            if item.description:
-                text += ' ' + item.description
-            texts.append(text)
+        texts = _item_texts(items)
         
         # 文本向量化
+        if self.use_hashing:
+            vectors = TfidfTransformer().fit_transform(self.vectorizer.transform(texts))
+            if not vectors.nnz:
+                # 没有任何有效词，返回单个话题
+                return [_single_topic(items)]
+            return self.cluster_precomputed(vectors, items, None)
+        
         try:
             vectors = self.vectorizer.fit_transform(texts)
         except ValueError:
             # 如果向量化失败（如所有文本相同），返回单个话题
-            return [Topic(
-                id=0,
-                name=items[0].title[:30] + '...' if len(items[0].title) > 30 else items[0].title,
-                keywords=[],
-                items=items,
-                source=items[0].source if items else ""
-            )]
-        
-        # K-Means 聚类
-        kmeans = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10)
+            return [_single_topic(items)]
+        
+        return self.cluster_precomputed(vectors, items, self.vectorizer.get_feature_names_out())
+    
+    def cluster_precomputed(self, vectors, items: List, feature_names) -> List[Topic]:
+        """
+        使用已向量化的数据进行聚类（跳过 TF-IDF 拟合）
+        
+        Args:
+            vectors: 与 items 一一对应的 TF-IDF 矩阵
+            items: 热点数据列表
+            feature_names: 向量各列对应的特征词；为 None 时（哈希向量）改用簇内高频词作为关键词
+            
+        Returns:
+            List[Topic]: 话题列表
+        """
+        if not items:
+            return []
+        
+        # 如果数据量小于聚类数，调整聚类数
+        if len(items) < self.n_clusters:
+            self.n_clusters = max(2, len(items) // 2) if len(items) > 2 else 1
+        
+        # 小语料直接用 numpy 实现的 K-Means，省去 sklearn 的参数校验与多次初始化开销
+        if len(items) < self.MINI_BATCH_THRESHOLD:
+            labels, centers = self._numpy_kmeans(sp.csr_matrix(vectors, dtype=np.float32), self.n_clusters)
+            return self._build_topics(items, labels, centers, feature_names)
+        
+        kmeans = MiniBatchKMeans(
+            n_clusters=self.n_clusters,
+            random_state=42,
+            n_init=3,
+            batch_size=max(32, min(256, len(items))),
+            max_no_improvement=10,
+            reassignment_ratio=0.01
+        )
         labels = kmeans.fit_predict(vectors)
+        return self._build_topics(items, labels, kmeans.cluster_centers_, feature_names)
+    
+    @staticmethod
+    def _numpy_kmeans(X, k: int, max_iter: int = 20, seed: int = 42):
+        """
+        numpy 实现的 K-Means（k-means++ 初始化 + Lloyd 迭代）
+        
+        稀疏输入不做稠密化，距离计算使用 scipy 的稀疏×稠密乘法，聚类中心保持稠密
         
-        # 获取特征词
-        feature_names = self.vectorizer.get_feature_names_out()
+        Args:
+            X: 特征矩阵 (n_samples, n_features)，CSR 稀疏矩阵或稠密数组
+            k: 聚类数量
+            max_iter: 最大迭代次数
+            seed: 随机种子
+            
+        Returns:
+            (labels, centers)
+        """
+        rng = np.random.default_rng(seed)
+        n = X.shape[0]
+        sparse = sp.issparse(X)
+        x_sq = np.asarray(X.multiply(X).sum(axis=1)).ravel() if sparse else (X * X).sum(axis=1)
+        
+        def row(i):
+            return X[i].toarray().ravel() if sparse else X[i]
+        
+        # k-means++ 初始化：按到最近中心距离的平方加权抽样
+        centers = np.empty((k, X.shape[1]), dtype=X.dtype)
+        centers[0] = row(rng.integers(n))
+        closest = np.maximum(x_sq - 2 * X @ centers[0] + centers[0] @ centers[0], 0)
+        for i in range(1, k):
+            total = closest.sum()
+            if total > 0:
+                idx = int(np.searchsorted(np.cumsum(closest), rng.random() * total))
+                idx = min(idx, n - 1)
+            else:
+                idx = int(rng.integers(n))
+            centers[i] = row(idx)
+            closest = np.minimum(closest, np.maximum(x_sq - 2 * X @ centers[i] + centers[i] @ centers[i], 0))
+        
+        # Lloyd 迭代：标签变化比例低于 1% 时提前结束
+        labels = np.full(n, -1)
+        for _ in range(max_iter):
+            dists = -2 * X @ centers.T + (centers * centers).sum(axis=1)
+            new_labels = dists.argmin(axis=1)
+            changed = np.count_nonzero(new_labels != labels)
+            labels = new_labels
+            
+            # 用 one-hot 稀疏矩阵一次性求各簇向量和
+            onehot = sp.csr_matrix((np.ones(n, dtype=X.dtype), (labels, np.arange(n))), shape=(k, n))
+            sums = onehot @ X
+            if sp.issparse(sums):
+                sums = sums.toarray()
+            counts = np.bincount(labels, minlength=k)
+            nonempty = counts > 0
+            # 空簇保留原中心
+            centers[nonempty] = sums[nonempty] / counts[nonempty, None]
+            
+            if changed < 0.01 * n:
+                break
+        
+        return labels, centers
+    
+    def _build_topics(self, items: List, labels, centers, feature_names) -> List[Topic]:
+        """根据聚类标签与聚类中心构建话题列表"""
+        # 按标签排序后切分，一次性得到各簇的数据项下标（只遍历非空簇）
+        order = np.argsort(labels, kind='stable')
+        unique_labels, counts = np.unique(labels, return_counts=True)
+        ends = np.cumsum(counts)
+        
+        scores_all = _hot_scores(items)
         
         # 构建话题
         topics = []
-        for i in range(self.n_clusters):
-            topic_items = [
-                items[j] for j in range(len(items)) if labels[j] == i
-            ]
-            
-            if not topic_items:
-                continue
+        for label, end, cnt in zip(unique_labels, ends, counts):
+            i = int(label)
+            topic_idx = order[end - cnt:end]
+            topic_items = [items[j] for j in topic_idx]
+            scores = scores_all[topic_idx]
             
             # 提取话题关键词
-            center = kmeans.cluster_centers_[i]
-            top_indices = center.argsort()[-5:][::-1]
-            topic_keywords = [feature_names[j] for j in top_indices if j < len(feature_names)]
-            
-            # 过滤掉无意义的关键词
-            topic_keywords = self._filter_keywords(topic_keywords)
+            if feature_names is None:
+                topic_keywords = self._frequent_keywords(
+                    _content_tokens(text) for text in _item_texts(topic_items)
+                )
+            else:
+                center = np.asarray(centers[i]).ravel()
+                top_n = min(5, center.size)
+                part = np.argpartition(center, -top_n)[-top_n:]
+                top_indices = part[np.argsort(center[part])[::-1]]
+                topic_keywords = [feature_names[j] for j in top_indices if j < len(feature_names)]
+                
+                # 过滤掉无意义的关键词
+                topic_keywords = self._filter_keywords(topic_keywords)
             
             # 生成话题名称（使用热度最高的数据项标题）
-            topic_name = self._generate_topic_name(topic_items)
+            topic_name = self._generate_topic_name(topic_items, scores)
             
             topics.append(Topic(
                 id=i,
                 name=topic_name,
                 keywords=topic_keywords,
                 items=topic_items,
-                source=topic_items[0].source if topic_items else ""
+                source=topic_items[0].source,
+                item_count=len(topic_items),
+                total_heat=float(scores.sum())
             ))
         
         # 按话题内数据量排序
         topics.sort(key=lambda x: x.item_count, reverse=True)
         return topics
     
+    def update(self, new_items: List):
+        """
+        增量更新聚类状态：仅对新增数据项分词，累计文档频率，并以 partial_fit 热启动聚类中心
+        
+        Args:
+            new_items: 上次调用后新增的数据项
+        """
+        if not new_items:
+            return
+        
+        if self._hasher is None:
+            self._hasher = _build_hashing_vectorizer(self.max_features)
+        counts = self._hasher.transform(_item_texts(new_items))
+        for i, item in enumerate(new_items):
+            self._rows[_item_key(item)] = counts[i]
+        
+        self._df += np.asarray((counts > 0).sum(axis=0)).ravel()
+        self._n_docs += counts.shape[0]
+        
+        if self._model is None:
+            self._model = MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                random_state=42,
+                n_init=3,
+                batch_size=max(32, min(256, len(new_items))),
+                reassignment_ratio=0.01
+            )
+        # 首次拟合至少需要 n_clusters 个样本
+        if hasattr(self._model, 'cluster_centers_') or counts.shape[0] >= self.n_clusters:
+            self._model.partial_fit(self._weight(counts))
+    
+    def cluster_incremental(self, items: List) -> List[Topic]:
+        """
+        基于持久化状态对当前数据项聚类，只有新增数据项需要分词和更新模型
+        
+        Args:
+            items: 当前全部热点数据
+            
+        Returns:
+            List[Topic]: 话题列表
+        """
+        if not items:
+            return []
+        
+        keys = [_item_key(item) for item in items]
+        self.update([item for item, key in zip(items, keys) if key not in self._rows])
+        # 只保留当前数据项的词频行，已下线的数据项不再参与聚类
+        self._rows = {key: self._rows[key] for key in keys}
+        
+        if not hasattr(self._model, 'cluster_centers_'):
+            # 累计数据尚不足以初始化模型
+            return self.cluster(items)
+        
+        vectors = self._weight(sp.vstack([self._rows[key] for key in keys]))
+        labels = self._model.predict(vectors)
+        return self._build_topics(items, labels, self._model.cluster_centers_, None)
+    
+    def _weight(self, counts):
+        """按累计文档频率计算 TF-IDF 并做 L2 归一化"""
+        idf = (np.log((1 + self._n_docs) / (1 + self._df)) + 1).astype(np.float32)
+        return normalize(sp.csr_matrix(counts.multiply(idf)))
+    
+    def _cluster_tiny(self, items: List) -> List[Topic]:
+        """
+        小语料快速聚类：按词集合的 Jaccard 相似度贪心合并
+        
+        Args:
+            items: 热点数据列表（数量不超过 TINY_THRESHOLD）
+            
+        Returns:
+            List[Topic]: 话题列表
+        """
+        # 如果数据量小于聚类数，调整聚类数
+        if len(items) < self.n_clusters:
+            self.n_clusters = max(2, len(items) // 2) if len(items) > 2 else 1
+        
+        tokens = [_content_tokens(text) for text in _item_texts(items)]
+        groups = [[i] for i in range(len(items))]
+        group_words = [frozenset(t) for t in tokens]
+        
+        # 每次合并最相似的两组，直到组数不超过聚类数且不存在足够相似的组；
+        # 没有任何共同词的组不合并（此时话题数可能多于聚类数）
+        while len(groups) > 1:
+            best, best_pair = -1.0, None
+            for a in range(len(groups)):
+                for b in range(a + 1, len(groups)):
+                    union = group_words[a] | group_words[b]
+                    sim = len(group_words[a] & group_words[b]) / len(union) if union else 0.0
+                    if sim > best:
+                        best, best_pair = sim, (a, b)
+            if best <= 0 or (len(groups) <= self.n_clusters and best < self.TINY_MERGE_SIMILARITY):
+                break
+            a, b = best_pair
+            groups[a].extend(groups.pop(b))
+            group_words[a] = group_words[a] | group_words.pop(b)
+        
+        scores_all = _hot_scores(items)
+        topics = []
+        for i, members in enumerate(groups):
+            topic_items = [items[j] for j in members]
+            scores = scores_all[members]
+            topic_keywords = self._frequent_keywords(tokens[j] for j in members)
+            topics.append(Topic(
+                id=i,
+                name=self._generate_topic_name(topic_items, scores),
+                keywords=topic_keywords,
+                items=topic_items,
+                source=topic_items[0].source,
+                item_count=len(topic_items),
+                total_heat=float(scores.sum())
+            ))
+        
+        # 按话题内数据量排序
+        topics.sort(key=lambda x: x.item_count, reverse=True)
+        return topics
+    
+    def _frequent_keywords(self, token_lists) -> List[str]:
+        """按簇内词频选取关键词"""
+        word_counts = Counter()
+        for tokens in token_lists:
+            word_counts.update(tokens)
+        return self._filter_keywords([w for w, _ in word_counts.most_common(10)])
+    
     def _filter_keywords(self, keywords: List[str]) -> List[str]:
         """过滤无意义的关键词"""
-        # 英文停用词
-        english_stop_words = {
-            'hn', 'show', 'ask', 'tell', 'new', 'use', 'using', 'used',
-            'build', 'building', 'built', 'make', 'making', 'made',
-            'create', 'creating', 'created', 'write', 'writing', 'written',
-            'time', 'year', 'day', 'way', 'work', 'worked', 'working',
-            'run', 'running', 'ran', 'start', 'started', 'starting',
-            'get', 'getting', 'got', 'use', 'using', 'used',
-            'open', 'source', 'github', 'project', 'tool', 'app',
-            'web', 'site', 'online', 'free', 'version', 'update',
-            'release', 'launch', 'announced', 'available', 'based',
-            'simple', 'easy', 'fast', 'quick', 'better', 'best',
-            'how', 'what', 'why', 'when', 'where', 'who', 'which',
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all',
-        }
-        
-        # 中文停用词
-        chinese_stop_words = {
-            '的', '了', '在', '是', '我', '有', '和', '就', '不', '人',
-            '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去',
-            '你', '会', '着', '没有', '看', '好', '自己', '这', '那',
-            '这些', '那些', '这个', '那个', '之', '与', '及', '等',
-            '可以', '需要', '进行', '通过', '使用', '基于', '实现',
-            '方法', '系统', '技术', '应用', '研究', '分析', '介绍',
-            '分享', '讨论', '问题', '解决方案', '建议', '推荐',
-        }
-        
-        filtered = []
-        for kw in keywords:
-            kw_lower = kw.lower()
-            # 过滤英文停用词
-            if kw_lower in english_stop_words:
-                continue
-            # 过滤中文停用词
-            if kw in chinese_stop_words:
-                continue
-            # 过滤纯数字
-            if kw.isdigit():
-                continue
-            # 过滤长度小于2的词
-            if len(kw) < 2:
-                continue
-            # 过滤纯标点
-            if re.match(r'^[^\w\u4e00-\u9fff]+$', kw):
-                continue
-            filtered.append(kw)
+        filtered = [
+            kw for kw in keywords
+            if kw.lower() not in _EN_STOP      # 英文停用词
+            and kw not in _ZH_STOP             # 中文停用词
+            and not kw.isdigit()               # 纯数字
+            and len(kw) >= 2                   # 长度小于2的词
+            and not _PUNCT_RE.match(kw)        # 纯标点
+        ]
         
         return filtered[:5]  # 最多返回5个关键词
     
-    def _generate_topic_name(self, items: List) -> str:
-        """生成话题名称"""
+    def _generate_topic_name(self, items: List, scores: Optional[np.ndarray] = None) -> str:
+        """生成话题名称（scores 为与 items 对应的热度数组，未提供时现场计算）"""
         if not items:
             return "未命名话题"
         
         # 策略1：优先使用热度最高的数据项标题
-        hottest = max(items, key=lambda x: x.hot_score or 0)
+        if scores is None:
+            scores = _hot_scores(items)
+        hottest = items[int(scores.argmax())]
         
         # 策略2：如果最高热度项太短，尝试找共同关键词
         if len(items) > 1:
-            # 提取所有标题中的关键词
-            all_words = []
+            # 提取所有标题中的关键词并统计词频
+            word_counts = Counter()
             for item in items:
-                # 简单的分词：提取中英文单词
-                words = re.findall(r'[\u4e00-\u9fff]{2,}|[a-zA-Z]{3,}', item.title)
-                all_words.extend(words)
-            
-            # 统计词频
-            from collections import Counter
-            word_counts = Counter(all_words)
+                word_counts.update(_TITLE_TOKEN_RE.findall(item.title))
             
             # 找出共同关键词（出现次数>1的词）
             common_words = [word for word, count in word_counts.most_common(3) if count > 1]
@@ -218,49 +523,67 @@ class TopicCluster:
         return title
 
 
-def cluster_items_by_source(items: List, n_clusters: int = 3) -> Dict[str, List[Topic]]:
+# 增量模式下按数据源持久化的聚类器
+_INCREMENTAL_CLUSTERERS: Dict[str, TopicCluster] = {}
+
+
+def cluster_items_by_source(items: List, n_clusters: int = 3,
+                            incremental: bool = False) -> Dict[str, List[Topic]]:
     """
     按数据源分组进行话题聚类
     
     Args:
         items: 热点数据列表
         n_clusters: 每个数据源的聚类数
+        incremental: 复用各数据源上次调用的聚类状态，仅处理新增数据项
         
     Returns:
         Dict[str, List[Topic]]: 各数据源的话题列表
     """
-    from collections import defaultdict
-    
     # 按数据源分组
     by_source = defaultdict(list)
     for item in items:
         by_source[item.source].append(item)
     
-    # 为每个数据源进行聚类
-    result = {}
-    for source, source_items in by_source.items():
-        if len(source_items) >= 3:  # 至少需要3条数据才能聚类
-            # 根据数据量动态调整聚类数
-            actual_clusters = min(n_clusters, len(source_items) // 2)
-            actual_clusters = max(2, actual_clusters)  # 至少2个话题
-            
-            clusterer = TopicCluster(n_clusters=actual_clusters)
-            topics = clusterer.cluster(source_items)
-            # 按话题总热度排序
-            topics.sort(key=lambda x: x.total_heat, reverse=True)
-            result[source] = topics
-        elif len(source_items) > 0:
-            # 数据太少，直接作为一个话题
-            topic = Topic(
-                id=0,
-                name=source_items[0].title[:40] + '...' if len(source_items[0].title) > 40 else source_items[0].title,
-                keywords=[],
-                items=source_items,
-                source=source
-            )
-            result[source] = [topic]
+    # 各数据源之间互不依赖，并行聚类（numpy / sklearn 的计算热点会释放 GIL）；
+    # 每个数据源单独拟合 TF-IDF 词表，小数据源的关键词不受大数据源挤占
+    tasks = list(by_source.items())
+    if len(tasks) <= 1:
+        return dict(_cluster_one_source(source, source_items, n_clusters, incremental)
+                    for source, source_items in tasks)
+    
+    with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(_cluster_one_source, source, source_items, n_clusters, incremental)
+            for source, source_items in tasks
+        ]
+        return dict(future.result() for future in futures)
+
+
+def _cluster_one_source(source: str, source_items: List,
+                        n_clusters: int, incremental: bool) -> Tuple[str, List[Topic]]:
+    """对单个数据源进行聚类，返回 (数据源, 话题列表)"""
+    tiny = len(source_items) <= TopicCluster.TINY_THRESHOLD
+    if len(source_items) >= 3:  # 至少需要3条数据才能聚类
+        # 根据数据量动态调整聚类数
+        actual_clusters = min(n_clusters, len(source_items) // 2)
+        actual_clusters = max(2, actual_clusters)  # 至少2个话题
+        
+        if tiny:
+            topics = TopicCluster(n_clusters=actual_clusters)._cluster_tiny(source_items)
+        elif incremental:
+            clusterer = _INCREMENTAL_CLUSTERERS.get(source)
+            if clusterer is None or clusterer.n_clusters != actual_clusters:
+                clusterer = _INCREMENTAL_CLUSTERERS[source] = TopicCluster(n_clusters=actual_clusters)
+            topics = clusterer.cluster_incremental(source_items)
+        else:
+            topics = TopicCluster(n_clusters=actual_clusters).cluster(source_items)
+        # 按话题总热度排序
+        topics.sort(key=lambda x: x.total_heat, reverse=True)
+        return source, topics
     
-    return result
+    # 数据太少，直接作为一个话题
+    return source, [_single_topic(source_items, source=source, max_len=40)]
 
 
 if __name__ == '__main__':
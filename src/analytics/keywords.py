@@ -3,140 +3,252 @@
 使用 jieba 进行中文分词和关键词提取
 """
 
-import jieba
-import jieba.analyse
-from collections import Counter
-from typing import List, Dict, Set, TYPE_CHECKING
+try:
+    # jieba_fast 为 C 扩展实现，接口与 jieba 一致，可显著加快分词与 TF-IDF 提取
+    import jieba_fast as jieba
+    import jieba_fast.analyse
+except ImportError:
+    import jieba
+    import jieba.analyse
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Iterable, Optional, Tuple, TYPE_CHECKING
+import atexit
+import os
 import re
+import threading
 
 if TYPE_CHECKING:
     from src.fetchers import TrendingItem
 
 
-class KeywordExtractor:
-    """关键词提取器"""
+# 文本预处理用的预编译正则
+_URL_RE = re.compile(r'https?://\S+')
+_NONWORD_RE = re.compile(r'[^\u4e00-\u9fa5a-zA-Z0-9\s]')
+# ASCII 范围内的特殊字符直接用 str.translate 替换为空格，比正则逐字符匹配快
+_ASCII_PUNCT_TABLE = {
+    i: ' ' for i in range(128) if not (chr(i).isalnum() or chr(i).isspace())
+}
+
+# 停用词集合 - 扩展版本
+_STOP_WORDS: FrozenSet[str] = frozenset({
+    # 中文常用停用词
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也',
+    '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这', '那',
+    '这些', '那些', '这个', '那个', '之', '与', '及', '等', '或', '但', '而', '如果', '因为',
+    '所以', '可以', '可能', '需要', '进行', '通过', '对于', '关于', '作为', '成为', '使用',
+    '基于', '实现', '支持', '提供', '包括', '包含', '涉及', '相关', '主要', '重要', '最新',
+    '第一', '如何', '什么', '为什么', '怎么', '怎样', '介绍', '分享', '讨论', '我们', '你们',
+    '他们', '它们', '这里', '那里', '哪里', '时候', '现在', '今天', '明天', '昨天', '已经',
+    '正在', '开始', '结束', '完成', '得到', '做出', '提出', '发现', '认为', '表示', '觉得',
+    
+    # HackerNews 特有停用词
+    'hn', 'show', 'ask', 'tell', 'launch', 'project', 'built', 'made', 'created',
+    'using', 'used', 'use', 'new', 'way', 'make', 'get', 'like', 'just', 'now',
+    'time', 'year', 'years', 'day', 'days', 'week', 'month', 'work', 'works',
+    'web', 'site', 'website', 'online', 'app', 'application', 'tool', 'tools',
+    'system', 'service', 'platform', 'feature', 'features', 'update', 'version',
+    'release', 'released', 'launch', 'launched', 'announced', 'available',
+    'free', 'open', 'source', 'github', 'code', 'repo', 'repository',
+    'write', 'writing', 'written', 'wrote', 'article', 'post', 'blog',
+    'read', 'reading', 'book', 'books', 'paper', 'papers', 'documentation',
+    'learn', 'learning', 'learned', 'tutorial', 'guide', 'course', 'courses',
+    
+    # 常见无意义词汇
+    'vs', 'via', 'per', 'one', 'two', 'three', 'first', 'second', 'last',
+    'next', 'previous', 'back', 'forward', 'up', 'down', 'left', 'right',
+    'more', 'less', 'most', 'least', 'many', 'much', 'some', 'any', 'all',
+    'each', 'every', 'both', 'either', 'neither', 'other', 'another',
+    'same', 'different', 'such', 'only', 'even', 'also', 'still', 'yet',
+    'already', 'always', 'never', 'sometimes', 'often', 'usually',
+    
+    # 技术通用停用词
+    'api', 'http', 'https', 'www', 'com', 'org', 'net', 'io', 'html', 'css',
+    'js', 'javascript', 'python', 'java', 'go', 'rust', 'cpp', 'c++', 'ruby',
+    'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'nosql',
+    'web', 'mobile', 'desktop', 'server', 'client', 'frontend', 'backend',
+    'database', 'db', 'cache', 'cloud', 'aws', 'azure', 'gcp', 'docker',
+    'kubernetes', 'k8s', 'container', 'containers', 'microservice',
+    'architecture', 'framework', 'library', 'libraries', 'package', 'module',
+    'component', 'components', 'function', 'functions', 'method', 'methods',
+    'class', 'classes', 'object', 'objects', 'variable', 'variables',
+    'data', 'type', 'types', 'string', 'strings', 'number', 'numbers',
+    'array', 'arrays', 'list', 'lists', 'map', 'maps', 'set', 'sets',
+    'key', 'keys', 'value', 'values', 'item', 'items', 'element', 'elements',
+    'user', 'users', 'admin', 'root', 'default', 'test', 'testing',
+    'dev', 'development', 'prod', 'production', 'staging', 'local',
+    'build', 'building', 'built', 'deploy', 'deployment', 'deployed',
+    'run', 'running', 'start', 'starting', 'started', 'stop', 'stopping',
+    'stopped', 'install', 'installation', 'installed', 'setup', 'set',
+    'configure', 'configuration', 'configured', 'setting', 'settings',
+    'option', 'options', 'param', 'params', 'parameter', 'parameters',
+    'arg', 'args', 'argument', 'arguments', 'flag', 'flags',
+    'enable', 'enabled', 'disable', 'disabled', 'active', 'inactive',
+    'true', 'false', 'yes', 'no', 'on', 'off', 'null', 'none', 'nil',
+    'error', 'errors', 'exception', 'exceptions', 'bug', 'bugs', 'fix',
+    'fixed', 'issue', 'issues', 'problem', 'problems', 'solution', 'solutions',
+    'support', 'supported', 'unsupported', 'compatible', 'compatibility',
+    'performance', 'optimization', 'optimize', 'optimized', 'speed', 'fast',
+    'slow', 'memory', 'cpu', 'gpu', 'disk', 'storage', 'network', 'bandwidth',
+    'security', 'secure', 'insecure', 'safe', 'unsafe', 'privacy', 'private',
+    'public', 'protected', 'internal', 'external', 'import', 'export',
+    'input', 'output', 'in', 'out', 'read', 'write', 'open', 'close',
+    'create', 'created', 'creation', 'delete', 'deleted', 'deletion',
+    'remove', 'removed', 'removal', 'add', 'added', 'addition', 'update',
+    'updated', 'updating', 'upgrade', 'upgraded', 'downgrade', 'downgraded',
+    'change', 'changed', 'changing', 'modify', 'modified', 'modification',
+    'edit', 'edited', 'editing', 'save', 'saved', 'saving', 'load', 'loaded',
+    'loading', 'import', 'imported', 'importing', 'export', 'exported',
+    'exporting', 'parse', 'parsed', 'parsing', 'serialize', 'serialized',
+    'serialization', 'deserialize', 'deserialized', 'deserialization',
+    'encode', 'encoded', 'encoding', 'decode', 'decoded', 'decoding',
+    'encrypt', 'encrypted', 'encryption', 'decrypt', 'decrypted', 'decryption',
+    'compress', 'compressed', 'compression', 'decompress', 'decompressed',
+    'decompression', 'zip', 'unzip', 'gzip', 'tar', 'rar', '7z',
+    'format', 'formats', 'convert', 'converted', 'conversion', 'transform',
+    'transformed', 'transformation', 'translate', 'translated', 'translation',
+    'generate', 'generated', 'generation', 'create', 'created', 'creation',
+    'make', 'made', 'produce', 'produced', 'production', 'render', 'rendered',
+    'rendering', 'draw', 'drawn', 'drawing', 'paint', 'painted', 'painting',
+    'display', 'displayed', 'displaying', 'show', 'showed', 'shown', 'showing',
+    'hide', 'hidden', 'hiding', 'visible', 'invisible', 'appear', 'appeared',
+    'appearing', 'disappear', 'disappeared', 'disappearing', 'view', 'viewed',
+    'viewing', 'watch', 'watched', 'watching', 'see', 'seen', 'seeing',
+    'look', 'looked', 'looking', 'find', 'found', 'finding', 'search',
+    'searched', 'searching', 'query', 'queried', 'querying', 'filter',
+    'filtered', 'filtering', 'sort', 'sorted', 'sorting', 'order', 'ordered',
+    'ordering', 'rank', 'ranked', 'ranking', 'rate', 'rated', 'rating',
+    'score', 'scored', 'scoring', 'point', 'points', 'count', 'counted',
+    'counting', 'number', 'numbers', 'total', 'sum', 'average', 'mean',
+    'median', 'mode', 'min', 'max', 'minimum', 'maximum', 'limit', 'limited',
+    'limiting', 'offset', 'page', 'pages', 'pagination', 'cursor', 'cursors',
+    'index', 'indexes', 'indices', 'key', 'keys', 'primary', 'foreign',
+    'unique', 'duplicate', 'duplicates', 'copy', 'copied', 'copying',
+    'clone', 'cloned', 'cloning', 'fork', 'forked', 'forking', 'branch',
+    'branches', 'branched', 'branching', 'merge', 'merged', 'merging',
+    'commit', 'commits', 'committed', 'committing', 'push', 'pushed',
+    'pushing', 'pull', 'pulled', 'pulling', 'fetch', 'fetched', 'fetching',
+    'clone', 'cloned', 'cloning', 'checkout', 'checked', 'checking',
+    'status', 'log', 'logs', 'history', 'diff', 'diffs', 'patch', 'patches',
+    'blame', 'annotate', 'tag', 'tags', 'tagged', 'tagging', 'release',
+    'releases', 'released', 'releasing', 'version', 'versions', 'v',
+    'alpha', 'beta', 'rc', 'stable', 'latest', 'nightly', 'snapshot',
+    'draft', 'prerelease', 'pre-release', 'deprecated', 'obsolete',
+    'legacy', 'modern', 'current', 'old', 'new', 'initial', 'final',
+})
+
+# 技术领域专业词汇（保留这些词）
+_TECH_TERMS: FrozenSet[str] = frozenset({
+    'ai', 'artificial', 'intelligence', 'machine', 'learning', 'ml',
+    'deep', 'neural', 'network', 'networks', 'nlp', 'cv', 'vision',
+    'llm', 'llms', 'gpt', 'chatgpt', 'claude', 'gemini', 'llama',
+    'transformer', 'transformers', 'bert', 'gpt2', 'gpt3', 'gpt4',
+    'diffusion', 'stable', 'midjourney', 'dalle', 'dall-e',
+    'tensorflow', 'pytorch', 'keras', 'jax', 'onnx', 'huggingface',
+    'langchain', 'llamaindex', 'openai', 'anthropic', 'cohere',
+    'vector', 'embedding', 'embeddings', 'rag', 'agent', 'agents',
+    'prompt', 'prompts', 'prompting', 'fine-tune', 'finetune',
+    'training', 'inference', 'model', 'models', 'dataset', 'datasets',
+    'benchmark', 'benchmarks', 'evaluation', 'metric', 'metrics',
+})
+
+
+def _item_text(title: str, description: str) -> str:
+    """组合标题和描述"""
+    if description and description != '-':
+        return title + ' ' + description
+    return title
+
+
+# 进程池工作进程内的关键词提取器（每个工作进程初始化一次）
+_worker_extractor = None
+
+
+def _init_worker(top_k: int, allow_pos: tuple, stop_words: Optional[FrozenSet[str]]):
+    """
+    进程池工作进程初始化：创建与主进程参数一致的提取器
+    
+    stop_words 为 None 表示使用默认停用词，工作进程直接引用自身模块中的常量，
+    无需经 pickle 传入一份副本（fork 启动时与主进程共享同一份内存页）
+    """
+    global _worker_extractor
+    # 启动时即加载词典（fork 时已在主进程加载则为空操作），避免首个任务承担加载耗时
+    jieba.initialize()
+    _worker_extractor = KeywordExtractor(top_k=top_k, allow_pos=allow_pos)
+    if stop_words is not None:
+        _worker_extractor.stop_words = stop_words
+
+
+def _extract_worker(args: Tuple[str, str]) -> List[str]:
+    """进程池任务：从 (标题, 描述) 中提取关键词"""
+    title, description = args
+    return _worker_extractor.extract(_item_text(title, description))
+
+
+@lru_cache(maxsize=8192)
+def _preprocess(text: str) -> str:
+    """预处理文本：移除 URL 与特殊字符，合并空白并转小写"""
+    # 移除 URL
+    text = _URL_RE.sub('', text)
     
-    # 停用词集合 - 扩展版本
-    STOP_WORDS: Set[str] = {
-        # 中文常用停用词
-        '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也',
-        '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这', '那',
-        '这些', '那些', '这个', '那个', '之', '与', '及', '等', '或', '但', '而', '如果', '因为',
-        '所以', '可以', '可能', '需要', '进行', '通过', '对于', '关于', '作为', '成为', '使用',
-        '基于', '实现', '支持', '提供', '包括', '包含', '涉及', '相关', '主要', '重要', '最新',
-        '第一', '如何', '什么', '为什么', '怎么', '怎样', '介绍', '分享', '讨论', '我们', '你们',
-        '他们', '它们', '这里', '那里', '哪里', '时候', '现在', '今天', '明天', '昨天', '已经',
-        '正在', '开始', '结束', '完成', '得到', '做出', '提出', '发现', '认为', '表示', '觉得',
+    # 移除特殊字符，但保留中英文；纯 ASCII 文本无需再走正则
+    text = text.translate(_ASCII_PUNCT_TABLE)
+    if not text.isascii():
+        text = _NONWORD_RE.sub(' ', text)
+    
+    # 移除多余空格
+    return ' '.join(text.split()).lower()
+
+
+@lru_cache(maxsize=4096)
+def _extract_impl(text: str, top_k: int, allow_pos: tuple, stop: FrozenSet[str]) -> Tuple[str, ...]:
+    """
+    对预处理后的文本提取并过滤关键词（参数均可哈希，结果可缓存）
+    
+    停用词集合作为缓存键的一部分，增删停用词后自然命中新的缓存项
+    """
+    # 使用 TF-IDF 算法提取关键词
+    keywords = jieba.analyse.extract_tags(
+        text,
+        topK=top_k * 2,  # 提取更多，然后过滤
+        withWeight=False,
+        allowPOS=allow_pos
+    )
+    
+    # 过滤停用词和短词（文本已在预处理中转为小写，候选词无需再逐个 lower()）
+    filtered = []
+    for kw in keywords:
+        # 跳过长度过短的词、停用词和纯数字（按开销从低到高排列判断）
+        if len(kw) < 2 or kw in stop or kw.isdigit():
+            continue
         
-        # HackerNews 特有停用词
-        'hn', 'show', 'ask', 'tell', 'launch', 'project', 'built', 'made', 'created',
-        'using', 'used', 'use', 'new', 'way', 'make', 'get', 'like', 'just', 'now',
-        'time', 'year', 'years', 'day', 'days', 'week', 'month', 'work', 'works',
-        'web', 'site', 'website', 'online', 'app', 'application', 'tool', 'tools',
-        'system', 'service', 'platform', 'feature', 'features', 'update', 'version',
-        'release', 'released', 'launch', 'launched', 'announced', 'available',
-        'free', 'open', 'source', 'github', 'code', 'repo', 'repository',
-        'write', 'writing', 'written', 'wrote', 'article', 'post', 'blog',
-        'read', 'reading', 'book', 'books', 'paper', 'papers', 'documentation',
-        'learn', 'learning', 'learned', 'tutorial', 'guide', 'course', 'courses',
+        # 多词组合（含空格）时检查是否主要由停用词组成
+        if ' ' in kw:
+            words = kw.split()
+            if len(words) > 1:
+                stop_word_count = sum(map(stop.__contains__, words))
+                if stop_word_count / len(words) > 0.5:
+                    continue
         
-        # 常见无意义词汇
-        'vs', 'via', 'per', 'one', 'two', 'three', 'first', 'second', 'last',
-        'next', 'previous', 'back', 'forward', 'up', 'down', 'left', 'right',
-        'more', 'less', 'most', 'least', 'many', 'much', 'some', 'any', 'all',
-        'each', 'every', 'both', 'either', 'neither', 'other', 'another',
-        'same', 'different', 'such', 'only', 'even', 'also', 'still', 'yet',
-        'already', 'always', 'never', 'sometimes', 'often', 'usually',
+        filtered.append(kw)
         
-        # 技术通用停用词
-        'api', 'http', 'https', 'www', 'com', 'org', 'net', 'io', 'html', 'css',
-        'js', 'javascript', 'python', 'java', 'go', 'rust', 'cpp', 'c++', 'ruby',
-        'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'nosql',
-        'web', 'mobile', 'desktop', 'server', 'client', 'frontend', 'backend',
-        'database', 'db', 'cache', 'cloud', 'aws', 'azure', 'gcp', 'docker',
-        'kubernetes', 'k8s', 'container', 'containers', 'microservice',
-        'architecture', 'framework', 'library', 'libraries', 'package', 'module',
-        'component', 'components', 'function', 'functions', 'method', 'methods',
-        'class', 'classes', 'object', 'objects', 'variable', 'variables',
-        'data', 'type', 'types', 'string', 'strings', 'number', 'numbers',
-        'array', 'arrays', 'list', 'lists', 'map', 'maps', 'set', 'sets',
-        'key', 'keys', 'value', 'values', 'item', 'items', 'element', 'elements',
-        'user', 'users', 'admin', 'root', 'default', 'test', 'testing',
-        'dev', 'development', 'prod', 'production', 'staging', 'local',
-        'build', 'building', 'built', 'deploy', 'deployment', 'deployed',
-        'run', 'running', 'start', 'starting', 'started', 'stop', 'stopping',
-        'stopped', 'install', 'installation', 'installed', 'setup', 'set',
-        'configure', 'configuration', 'configured', 'setting', 'settings',
-        'option', 'options', 'param', 'params', 'parameter', 'parameters',
-        'arg', 'args', 'argument', 'arguments', 'flag', 'flags',
-        'enable', 'enabled', 'disable', 'disabled', 'active', 'inactive',
-        'true', 'false', 'yes', 'no', 'on', 'off', 'null', 'none', 'nil',
-        'error', 'errors', 'exception', 'exceptions', 'bug', 'bugs', 'fix',
-        'fixed', 'issue', 'issues', 'problem', 'problems', 'solution', 'solutions',
-        'support', 'supported', 'unsupported', 'compatible', 'compatibility',
-        'performance', 'optimization', 'optimize', 'optimized', 'speed', 'fast',
-        'slow', 'memory', 'cpu', 'gpu', 'disk', 'storage', 'network', 'bandwidth',
-        'security', 'secure', 'insecure', 'safe', 'unsafe', 'privacy', 'private',
-        'public', 'protected', 'internal', 'external', 'import', 'export',
-        'input', 'output', 'in', 'out', 'read', 'write', 'open', 'close',
-        'create', 'created', 'creation', 'delete', 'deleted', 'deletion',
-        'remove', 'removed', 'removal', 'add', 'added', 'addition', 'update',
-        'updated', 'updating', 'upgrade', 'upgraded', 'downgrade', 'downgraded',
-        'change', 'changed', 'changing', 'modify', 'modified', 'modification',
-        'edit', 'edited', 'editing', 'save', 'saved', 'saving', 'load', 'loaded',
-        'loading', 'import', 'imported', 'importing', 'export', 'exported',
-        'exporting', 'parse', 'parsed', 'parsing', 'serialize', 'serialized',
-        'serialization', 'deserialize', 'deserialized', 'deserialization',
-        'encode', 'encoded', 'encoding', 'decode', 'decoded', 'decoding',
-        'encrypt', 'encrypted', 'encryption', 'decrypt', 'decrypted', 'decryption',
-        'compress', 'compressed', 'compression', 'decompress', 'decompressed',
-        'decompression', 'zip', 'unzip', 'gzip', 'tar', 'rar', '7z',
-        'format', 'formats', 'convert', 'converted', 'conversion', 'transform',
-        'transformed', 'transformation', 'translate', 'translated', 'translation',
-        'generate', 'generated', 'generation', 'create', 'created', 'creation',
-        'make', 'made', 'produce', 'produced', 'production', 'render', 'rendered',
-        'rendering', 'draw', 'drawn', 'drawing', 'paint', 'painted', 'painting',
-        'display', 'displayed', 'displaying', 'show', 'showed', 'shown', 'showing',
-        'hide', 'hidden', 'hiding', 'visible', 'invisible', 'appear', 'appeared',
-        'appearing', 'disappear', 'disappeared', 'disappearing', 'view', 'viewed',
-        'viewing', 'watch', 'watched', 'watching', 'see', 'seen', 'seeing',
-        'look', 'looked', 'looking', 'find', 'found', 'finding', 'search',
-        'searched', 'searching', 'query', 'queried', 'querying', 'filter',
-        'filtered', 'filtering', 'sort', 'sorted', 'sorting', 'order', 'ordered',
-        'ordering', 'rank', 'ranked', 'ranking', 'rate', 'rated', 'rating',
-        'score', 'scored', 'scoring', 'point', 'points', 'count', 'counted',
-        'counting', 'number', 'numbers', 'total', 'sum', 'average', 'mean',
-        'median', 'mode', 'min', 'max', 'minimum', 'maximum', 'limit', 'limited',
-        'limiting', 'offset', 'page', 'pages', 'pagination', 'cursor', 'cursors',
-        'index', 'indexes', 'indices', 'key', 'keys', 'primary', 'foreign',
-        'unique', 'duplicate', 'duplicates', 'copy', 'copied', 'copying',
-        'clone', 'cloned', 'cloning', 'fork', 'forked', 'forking', 'branch',
-        'branches', 'branched', 'branching', 'merge', 'merged', 'merging',
-        'commit', 'commits', 'committed', 'committing', 'push', 'pushed',
-        'pushing', 'pull', 'pulled', 'pulling', 'fetch', 'fetched', 'fetching',
-        'clone', 'cloned', 'cloning', 'checkout', 'checked', 'checking',
-        'status', 'log', 'logs', 'history', 'diff', 'diffs', 'patch', 'patches',
-        'blame', 'annotate', 'tag', 'tags', 'tagged', 'tagging', 'release',
-        'releases', 'released', 'releasing', 'version', 'versions', 'v',
-        'alpha', 'beta', 'rc', 'stable', 'latest', 'nightly', 'snapshot',
-        'draft', 'prerelease', 'pre-release', 'deprecated', 'obsolete',
-        'legacy', 'modern', 'current', 'old', 'new', 'initial', 'final',
-    }
+        # 达到目标数量就停止
+        if len(filtered) >= top_k:
+            break
     
-    # 技术领域专业词汇（保留这些词）
-    TECH_TERMS: Set[str] = {
-        'ai', 'artificial', 'intelligence', 'machine', 'learning', 'ml',
-        'deep', 'neural', 'network', 'networks', 'nlp', 'cv', 'vision',
-        'llm', 'llms', 'gpt', 'chatgpt', 'claude', 'gemini', 'llama',
-        'transformer', 'transformers', 'bert', 'gpt2', 'gpt3', 'gpt4',
-        'diffusion', 'stable', 'midjourney', 'dalle', 'dall-e',
-        'tensorflow', 'pytorch', 'keras', 'jax', 'onnx', 'huggingface',
-        'langchain', 'llamaindex', 'openai', 'anthropic', 'cohere',
-        'vector', 'embedding', 'embeddings', 'rag', 'agent', 'agents',
-        'prompt', 'prompts', 'prompting', 'fine-tune', 'finetune',
-        'training', 'inference', 'model', 'models', 'dataset', 'datasets',
-        'benchmark', 'benchmarks', 'evaluation', 'metric', 'metrics',
-    }
+    return tuple(filtered)
+
+
+class KeywordExtractor:
+    """关键词提取器"""
+    
+    # 批量提取的数据量达到该阈值时使用进程池并行（低于该值时进程启动与 jieba 加载开销得不偿失）
+    PARALLEL_THRESHOLD = 1000
+    
+    # 停用词集合与技术词汇（模块级常量，见 _STOP_WORDS / _TECH_TERMS）
+    STOP_WORDS: FrozenSet[str] = _STOP_WORDS
+    TECH_TERMS: FrozenSet[str] = _TECH_TERMS
     
     def __init__(self, top_k: int = 10, allow_pos: tuple = ('ns', 'n', 'vn', 'v', 'nr', 'nz', 'eng')):
         """
@@ -147,23 +259,18 @@ class KeywordExtractor:
             allow_pos: 允许的词性（地名、名词、动名词、动词、人名、专有名词、英文）
         """
         self.top_k = top_k
-        self.allow_pos = allow_pos
+        self.allow_pos = tuple(allow_pos)
+        # 实例级停用词：默认直接引用模块常量，增删停用词时替换为新的 frozenset
+        self.stop_words: FrozenSet[str] = _STOP_WORDS
+        # 批量提取用的进程池（按需创建）
+        self._pool = None
+        self._pool_config = None
     
     def _preprocess_text(self, text: str) -> str:
         """预处理文本"""
         if not text:
             return ""
-        
-        # 移除 URL
-        text = re.sub(r'https?://\S+', '', text)
-        
-        # 移除特殊字符，但保留中英文
-        text = re.sub(r'[^\u4e00-\u9fa5a-zA-Z0-9\s]', ' ', text)
-        
-        # 移除多余空格
-        text = ' '.join(text.split())
-        
-        return text.lower()
+        return _preprocess(text)
     
     def extract(self, text: str) -> List[str]:
         """
@@ -184,46 +291,8 @@ class KeywordExtractor:
         if not text:
             return []
         
-        # 使用 TF-IDF 算法提取关键词
-        keywords = jieba.analyse.extract_tags(
-            text,
-            topK=self.top_k * 2,  # 提取更多，然后过滤
-            withWeight=False,
-            allowPOS=self.allow_pos
-        )
-        
-        # 过滤停用词和短词
-        filtered = []
-        for kw in keywords:
-            kw_lower = kw.lower()
-            
-            # 跳过停用词
-            if kw_lower in self.STOP_WORDS:
-                continue
-            
-            # 跳过纯数字
-            if kw.isdigit():
-                continue
-            
-            # 跳过长度过短的词（英文至少3个字符，中文至少2个）
-            if len(kw) < 2:
-                continue
-            
-            # 检查是否包含太多停用词
-            words = kw_lower.split()
-            if len(words) > 1:
-                # 如果是多词组合，检查是否主要由停用词组成
-                stop_word_count = sum(1 for w in words if w in self.STOP_WORDS)
-                if stop_word_count / len(words) > 0.5:
-                    continue
-            
-            filtered.append(kw)
-            
-            # 达到目标数量就停止
-            if len(filtered) >= self.top_k:
-                break
-        
-        return filtered
+        # 结果按 (文本, 参数, 停用词) 缓存，重复或转发的标题无需再次调用 jieba
+        return list(_extract_impl(text, self.top_k, self.allow_pos, self.stop_words))
     
     def extract_from_item(self, item) -> List[str]:
         """
@@ -235,12 +304,7 @@ class KeywordExtractor:
         Returns:
             List[str]: 关键词列表
         """
-        # 组合标题和描述
-        text = item.title
-        if item.description and item.description != '-':
-            text += ' ' + item.description
-        
-        return self.extract(text)
+        return self.extract(_item_text(item.title, item.description))
     
     def extract_from_items(self, items: List) -> Dict[str, int]:
         """
@@ -252,16 +316,21 @@ class KeywordExtractor:
         Returns:
             Dict[str, int]: 关键词及其出现次数
         """
-        all_keywords = []
-        
-        for item in items:
-            keywords = self.extract_from_item(item)
-            all_keywords.extend(keywords)
-        
-        # 统计词频
-        counter = Counter(all_keywords)
+        # 逐项累计词频，无需先汇总成中间列表
+        counter = Counter()
+        for keywords in self._extract_all(items):
+            counter.update(keywords)
         return dict(counter.most_common(50))
     
+    def _extract_all(self, items: List) -> Iterable[List[str]]:
+        """按顺序返回每个数据项的关键词列表"""
+        if len(items) >= self.PARALLEL_THRESHOLD:
+            # 数据量大时分发到进程池（jieba 纯 Python 实现持有 GIL，线程无法并行）
+            return self._get_pool().map(
+                _extract_worker, ((item.title, item.description) for item in items), chunksize=32
+            )
+        return map(self.extract_from_item, items)
+    
     def extract_by_source(self, items: List) -> Dict[str, Dict[str, int]]:
         """
         按数据源分组提取关键词
@@ -272,42 +341,89 @@ class KeywordExtractor:
         Returns:
             Dict[str, Dict[str, int]]: 各数据源的关键词统计
         """
-        from collections import defaultdict
+        # 每个数据项只提取一次，直接累计到所属数据源的词频
+        by_source = defaultdict(Counter)
+        for item, keywords in zip(items, self._extract_all(items)):
+            by_source[item.source].update(keywords)
         
-        # 按数据源分组
-        by_source = defaultdict(list)
-        for item in items:
-            by_source[item.source].append(item)
-        
-        # 为每个数据源提取关键词
-        result = {}
-        for source, source_items in by_source.items():
-            keywords = self.extract_from_items(source_items)
-            result[source] = keywords
-        
-        return result
+        return {source: dict(counter.most_common(50)) for source, counter in by_source.items()}
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """获取（必要时创建）关键词提取进程池，提取参数变化后重建"""
+        config = (self.top_k, self.allow_pos, self.stop_words)
+        if self._pool is None or self._pool_config != config:
+            self.close()
+            # 先在主进程加载 jieba 词典，fork 出的工作进程直接共享已构建的前缀词典
+            jieba.initialize()
+            self._pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_worker,
+                initargs=(self.top_k, self.allow_pos,
+                          None if self.stop_words is _STOP_WORDS else self.stop_words)
+            )
+            self._pool_config = config
+        return self._pool
+    
+    def close(self):
+        """关闭关键词提取进程池"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_config = None
     
     def add_stop_words(self, words: List[str]):
-        """添加停用词"""
-        self.STOP_WORDS.update(words)
+        """添加停用词（仅影响当前实例）"""
+        self.stop_words = self.stop_words.union(words)
     
     def remove_stop_words(self, words: List[str]):
-        """移除停用词"""
-        self.STOP_WORDS.difference_update(words)
+        """移除停用词（仅影响当前实例）"""
+        self.stop_words = self.stop_words.difference(words)
+
+
+# 按 top_k 共享的默认配置提取器；其进程池在 close_shared_extractors() 或进程退出时关闭
+_SHARED_EXTRACTORS: Dict[int, KeywordExtractor] = {}
+_SHARED_EXTRACTORS_LOCK = threading.Lock()
+
+
+def _shared_extractor(top_k: int) -> KeywordExtractor:
+    """按 top_k 复用默认配置的关键词提取器（提取过程不修改实例状态，可跨调用与线程共享）"""
+    with _SHARED_EXTRACTORS_LOCK:
+        extractor = _SHARED_EXTRACTORS.get(top_k)
+        if extractor is None:
+            extractor = _SHARED_EXTRACTORS[top_k] = KeywordExtractor(top_k=top_k)
+        return extractor
+
+
+def close_shared_extractors():
+    """关闭共享提取器持有的进程池（调度器停止及进程退出时调用）"""
+    with _SHARED_EXTRACTORS_LOCK:
+        extractors = list(_SHARED_EXTRACTORS.values())
+        _SHARED_EXTRACTORS.clear()
+    for extractor in extractors:
+        extractor.close()
+
+
+atexit.register(close_shared_extractors)
 
 
-def extract_keywords_for_items(items: List, top_k: int = 5) -> List:
+def extract_keywords_for_items(
+    items: List,
+    top_k: int = 5,
+    extractor: Optional[KeywordExtractor] = None
+) -> List:
     """
     为 TrendingItem 列表提取关键词并赋值
     
     Args:
         items: 热点数据列表
         top_k: 每个项目提取的关键词数量
+        extractor: 自定义提取器（可选），默认复用同 top_k 的共享实例
         
     Returns:
         List: 带有关键词的数据列表
     """
-    extractor = KeywordExtractor(top_k=top_k)
+    if extractor is None:
+        extractor = _shared_extractor(top_k)
     
     for item in items:
         item.keywords = extractor.extract_from_item(item)
@@ -5,7 +5,8 @@
 
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
+
+import numpy as np
 
 from src.db import TrendingDAO
 
@@ -42,27 +43,36 @@ class TrendAnalyzer:
             limit=1000
         )
         
-        # 按天统计
-        daily_counts = defaultdict(int)
-        daily_scores = defaultdict(list)
+        return self._build_keyword_trend(items, start_date, days)
+    
+    def _build_keyword_trend(self, items: List, start_date: date, days: int) -> List[Dict]:
+        """将关键词匹配到的数据按天汇总为趋势数据"""
+        # 按天统计：把日期换算成相对 start_date 的偏移，用 bincount 一次汇总数量与热度
+        n_days = days + 1
+        offsets = np.fromiter(
+            (item.fetched_at.toordinal() for item in items), dtype=np.int64, count=len(items)
+        ) - start_date.toordinal()
+        scores = np.fromiter(
+            (item.hot_score or 0.0 for item in items), dtype=np.float64, count=len(items)
+        )
+        in_range = (offsets >= 0) & (offsets < n_days)
+        offsets, scores = offsets[in_range], scores[in_range]
         
-        for item in items:
-            date_key = item.fetched_at.date()
-            daily_counts[date_key] += 1
-            if item.hot_score:
-                daily_scores[date_key].append(item.hot_score)
+        daily_counts = np.bincount(offsets, minlength=n_days)
+        # 热度只统计有分数的数据项
+        daily_sum = np.bincount(offsets, weights=scores, minlength=n_days)
+        daily_n = np.bincount(offsets, weights=scores != 0, minlength=n_days)
         
         # 构建趋势数据
         trend = []
-        for i in range(days + 1):
+        for i in range(n_days):
             current_date = start_date + timedelta(days=i)
-            count = daily_counts.get(current_date, 0)
-            scores = daily_scores.get(current_date, [])
-            avg_score = sum(scores) / len(scores) if scores else 0
+            n = daily_n[i]
+            avg_score = float(daily_sum[i]) / n if n else 0
             
             trend.append({
                 'date': current_date.isoformat(),
-                'count': count,
+                'count': int(daily_counts[i]),
                 'avg_score': round(avg_score, 2)
             })
         
@@ -86,13 +96,24 @@ class TrendAnalyzer:
         # 先获取最近的热门关键词
         recent_keywords = self.dao.get_trending_keywords(days=3, top_n=top_n)
         
-        result = {}
-        for kw_data in recent_keywords:
-            keyword = kw_data['keyword']
-            trend = self.get_keyword_trend(keyword, days)
-            result[keyword] = trend
+        return self._get_keywords_trends([kw_data['keyword'] for kw_data in recent_keywords], days)
+    
+    def _get_keywords_trends(self, keywords: List[str], days: int) -> Dict[str, List[Dict]]:
+        """单次查询获取多个关键词的趋势"""
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
         
-        return result
+        items_by_keyword = self.dao.get_items_by_keywords(
+            keywords,
+            start_date=start_date,
+            end_date=end_date,
+            limit_per_keyword=1000
+        )
+        
+        return {
+            keyword: self._build_keyword_trend(items_by_keyword[keyword], start_date, days)
+            for keyword in keywords
+        }
     
     def get_source_trend(
         self,
@@ -110,22 +131,18 @@ class TrendAnalyzer:
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        # 获取所有数据源
-        sources = self.dao.get_sources()
+        # 一次分组查询取回各数据源每日数量，再在内存中补零
+        counts = self.dao.get_counts_by_source_and_day(start_date, end_date)
         
         result = {}
-        for source in sources:
+        for source in self.dao.get_sources():
+            source_counts = counts.get(source, {})
             trend = []
             for i in range(days + 1):
                 current_date = start_date + timedelta(days=i)
-                count = self.dao.get_count(
-                    source=source,
-                    start_date=current_date,
-                    end_date=current_date
-                )
                 trend.append({
                     'date': current_date.isoformat(),
-                    'count': count
+                    'count': source_counts.get(current_date, 0)
                 })
             result[source] = trend
         
@@ -181,11 +198,7 @@ class TrendAnalyzer:
         Returns:
             Dict[str, List[Dict]]: 各关键词的趋势对比数据
         """
-        result = {}
-        for keyword in keywords:
-            trend = self.get_keyword_trend(keyword, days)
-            result[keyword] = trend
-        return result
+        return self._get_keywords_trends(keywords, days)
     
     def get_trend_summary(self, days: int = 7) -> Dict:
         """
@@ -200,27 +213,25 @@ class TrendAnalyzer:
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        # 获取总数据量趋势
+        # 获取总数据量趋势（一次分组查询，在内存中补零）
+        daily_counts = dict(self.dao.get_daily_counts(start_date, end_date))
         total_trend = []
         for i in range(days + 1):
             current_date = start_date + timedelta(days=i)
-            count = self.dao.get_count(
-                start_date=current_date,
-                end_date=current_date
-            )
             total_trend.append({
                 'date': current_date.isoformat(),
-                'count': count
+                'count': daily_counts.get(current_date, 0)
             })
         
         # 获取热门关键词
         hot_keywords = self.dao.get_trending_keywords(days=days, top_n=10)
         
         # 获取数据源分布
-        source_distribution = {}
-        for source in self.dao.get_sources():
-            count = self.dao.get_count(source=source, start_date=start_date, end_date=end_date)
-            source_distribution[source] = count
+        counts = self.dao.get_counts_by_source_and_day(start_date, end_date)
+        source_distribution = {
+            source: sum(counts.get(source, {}).values())
+            for source in self.dao.get_sources()
+        }
         
         return {
             'total_trend': total_trend,
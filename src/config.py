@@ -8,6 +8,7 @@ import yaml
 import hashlib
 import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Callable, List
 
 try:
@@ -165,6 +166,13 @@ def get_source_urls() -> Dict[str, Any]:
     return _config.get('source_urls', {})
 
 
+def _freeze(value: Any) -> Any:
+    """将嵌套 dict 转为只读的 MappingProxyType，防止模块级配置被意外修改"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
 class ConfigHotReloader:
     def __init__(self, interval: float = 2.0):
         self.interval = interval
@@ -199,7 +207,7 @@ class ConfigHotReloader:
 
 DATABASE = get_database()
 SERVER = get_server()
-DATA_SOURCES = get_data_sources()
+DATA_SOURCES = _freeze(get_data_sources())
 SCHEDULE = get_schedule()
 LOGGING = get_logging()
 REQUESTS = get_requests()
@@ -209,6 +217,9 @@ BROWSER = get_browser()
 PROXY = get_proxy()
 SOURCE_URLS = get_source_urls()
 
+# 启动时启用的数据源名称（与 DATA_SOURCES 一样在导入时确定）
+ENABLED_SOURCE_NAMES = tuple(name for name, cfg in DATA_SOURCES.items() if cfg.get('enabled'))
+
 
 def parse_cron_expression(cron_expr: str) -> dict:
     parts = cron_expr.strip().split()
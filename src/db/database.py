@@ -3,17 +3,37 @@
 """
 
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from contextlib import contextmanager
 
 
+# 每个线程按数据库路径缓存一个长连接，同一线程内的所有 DAO 实例共享，避免每次查询都重新建立连接；
+# 短生命周期线程（如每个 HTTP 请求一个线程）结束前应调用 Database.close_thread_connections()
+_thread_local = threading.local()
+
+# 连接级 PRAGMA（每个连接建立时设置一次）
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL;'
+    'PRAGMA temp_store=MEMORY;'
+    'PRAGMA mmap_size=268435456;'
+    'PRAGMA cache_size=-65536;'
+)
+
+
 class Database:
     """数据库管理类"""
     
+    # 本进程内已完成建表的数据库路径，同一数据库只初始化一次
+    _initialized_paths = set()
+    
     def __init__(self, db_path: Path):
         self.db_path = db_path
-        self._init_database()
+        key = str(db_path)
+        if key not in Database._initialized_paths:
+            self._init_database()
+            Database._initialized_paths.add(key)
     
     def _init_database(self):
         """初始化数据库"""
@@ -22,6 +42,8 @@ class Database:
         
         # 创建表结构
         with self.get_connection() as conn:
+            # WAL 模式持久化在数据库文件中，读写互不阻塞
+            conn.execute('PRAGMA journal_mode=WAL')
             self._create_tables(conn)
             self._create_indexes(conn)
     
@@ -130,23 +152,38 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_trending_source 
             ON trending_items(source)
         ''')
+        # 按日期过滤直接使用存储的生成列 fetched_date，不再维护 DATE(fetched_at) 表达式索引
+        cursor.execute('DROP INDEX IF EXISTS idx_trending_date')
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_trending_date 
-            ON trending_items(DATE(fetched_at))
+            CREATE INDEX IF NOT EXISTS idx_trending_fetched_date 
+            ON trending_items(fetched_date)
+        ''')
+        # 数据源 + 日期组合查询（按数据源统计、保存时查重）
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_trending_source_date 
+            ON trending_items(source, fetched_date)
         ''')
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_trending_fetched_at 
             ON trending_items(fetched_at)
         ''')
+        # 按数据源列出最新数据（ORDER BY fetched_at DESC）及取最新抓取时间时免排序
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_trending_source_fetched_at 
+            ON trending_items(source, fetched_at)
+        ''')
         
         # 每日统计表索引
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_stats_date 
             ON daily_stats(date)
         ''')
+        # UNIQUE(date, source) 已覆盖按日期范围查询；按数据源 + 日期范围查询用 (source, date)，
+        # 其前缀同时取代原单列 source 索引
+        cursor.execute('DROP INDEX IF EXISTS idx_stats_source')
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_stats_source 
-            ON daily_stats(source)
+            CREATE INDEX IF NOT EXISTS idx_stats_source_date 
+            ON daily_stats(source, date)
         ''')
 
         # 指数行情数据表索引
@@ -175,18 +212,51 @@ class Database:
 
         conn.commit()
     
+    def _get_thread_connection(self) -> sqlite3.Connection:
+        """获取当前线程的长连接（首次使用时创建并设置 PRAGMA）"""
+        connections = getattr(_thread_local, 'connections', None)
+        if connections is None:
+            connections = _thread_local.connections = {}
+        
+        key = str(self.db_path)
+        conn = connections.get(key)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(_CONNECTION_PRAGMAS)
+            connections[key] = conn
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """获取数据库连接（上下文管理器）"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """获取数据库连接（上下文管理器，正常退出时提交，异常时回滚）"""
+        conn = self._get_thread_connection()
         try:
             yield conn
             conn.commit()
         except Exception as e:
             conn.rollback()
             raise e
-        finally:
+    
+    def close(self):
+        """关闭当前线程持有的该数据库连接"""
+        connections = getattr(_thread_local, 'connections', None)
+        if connections:
+            conn = connections.pop(str(self.db_path), None)
+            if conn is not None:
+                conn.close()
+    
+    @staticmethod
+    def close_thread_connections():
+        """
+        关闭当前线程持有的全部数据库连接
+
+        供短生命周期线程在结束前调用（如 Werkzeug threaded 模式下每个请求一个线程，
+        在 teardown_request 中释放），避免连接要等到线程局部变量被回收时才关闭
+        """
+        connections = getattr(_thread_local, 'connections', None)
+        while connections:
+            _, conn = connections.popitem()
             conn.close()
     
     def execute(self, sql: str, parameters: tuple = ()) -> int:
@@ -209,6 +279,16 @@ class Database:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    def fetch_one_row(self, sql: str, parameters: tuple = ()) -> Optional[sqlite3.Row]:
+        """查询单条记录（返回 sqlite3.Row，按列名读取，不转换为 dict）"""
+        with self.get_connection() as conn:
+            return conn.execute(sql, parameters).fetchone()
+    
+    def fetch_all_rows(self, sql: str, parameters: tuple = ()) -> List[sqlite3.Row]:
+        """查询多条记录（返回 sqlite3.Row 列表，按列名读取，不转换为 dict）"""
+        with self.get_connection() as conn:
+            return conn.execute(sql, parameters).fetchall()
+    
     def get_last_insert_id(self) -> int:
         """获取最后插入的ID"""
         with self.get_connection() as conn:
@@ -5,6 +5,7 @@
 管理数据获取失败的记录和重试状态
 """
 
+import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -14,6 +15,16 @@ from enum import Enum
 from .database import Database
 
 
+def _parse_datetime(value) -> Optional[datetime]:
+    """将 SQLite 中存储的时间字符串解析为 datetime"""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 class FailureStatus(Enum):
     """失败记录状态"""
     PENDING = "pending"      # 等待重试
@@ -52,9 +63,18 @@ class FetchFailure:
 class FetchFailureDAO:
     """数据获取失败记录 DAO"""
     
+    # 清理过期记录时每批删除的条数
+    DELETE_BATCH_SIZE = 500
+    
+    # 本进程内已创建失败记录表的数据库路径，避免每次实例化都重复执行建表语句
+    _initialized_paths = set()
+    
     def __init__(self, db_path: Path):
         self.db = Database(db_path)
-        self._create_table()
+        key = str(db_path)
+        if key not in FetchFailureDAO._initialized_paths:
+            self._create_table()
+            FetchFailureDAO._initialized_paths.add(key)
     
     def _create_table(self):
         """创建失败记录表"""
@@ -77,13 +97,35 @@ class FetchFailureDAO:
             CREATE INDEX IF NOT EXISTS idx_fetch_failures_source 
             ON fetch_failures(source)
         ''')
+        # 待重试查询（status = 'pending' 且按 next_retry_at 排序）使用部分复合索引，
+        # 取代原先 status、next_retry_at 两个单列索引
+        self.db.execute('DROP INDEX IF EXISTS idx_fetch_failures_status')
+        self.db.execute('DROP INDEX IF EXISTS idx_fetch_failures_next_retry')
+        self.db.execute('''
+            CREATE INDEX IF NOT EXISTS idx_fetch_failures_pending_next
+            ON fetch_failures(status, next_retry_at) WHERE status = 'pending'
+        ''')
+        
+        # 清理过期记录与按更新时间排序的查询
         self.db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_fetch_failures_status 
-            ON fetch_failures(status)
+            CREATE INDEX IF NOT EXISTS idx_fetch_failures_updated_at
+            ON fetch_failures(updated_at)
         ''')
+        
+        # 每个数据源最多一条待重试记录（save_failure 的 upsert 依赖此唯一索引）
+        # 建索引前清理旧数据中可能存在的重复待重试记录，仅保留最新一条
         self.db.execute('''
-            CREATE INDEX IF NOT EXISTS idx_fetch_failures_next_retry 
-            ON fetch_failures(next_retry_at)
+            DELETE FROM fetch_failures
+            WHERE status = 'pending'
+              AND id NOT IN (
+                  SELECT MAX(id) FROM fetch_failures
+                  WHERE status = 'pending'
+                  GROUP BY source
+              )
+        ''')
+        self.db.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_fetch_failures_pending
+            ON fetch_failures(source) WHERE status = 'pending'
         ''')
     
     def save_failure(self, source: str, error_message: Optional[str],
@@ -103,46 +145,31 @@ class FetchFailureDAO:
         """
         now = datetime.now()
         
-        # 检查是否已存在记录
-        existing = self.get_by_source(source)
-        
-        if existing:
-            # 更新现有记录
-            self.db.execute('''
-                UPDATE fetch_failures
-                SET error_message = ?,
-                    retry_count = ?,
-                    last_try_at = ?,
-                    next_retry_at = ?,
-                    status = ?,
-                    updated_at = ?
-                WHERE source = ? AND status = 'pending'
-            ''', (
-                error_message,
-                retry_count,
-                now,
-                next_retry_at,
-                'pending',
-                now,
-                source
-            ))
-            return existing.id
-        else:
-            # 插入新记录
-            self.db.execute('''
+        # 单条 upsert：已有待重试记录则更新，否则插入新记录
+        with self.db.get_connection() as conn:
+            conn.execute('''
                 INSERT INTO fetch_failures
                 (source, error_message, retry_count, last_try_at, next_retry_at, status, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, 'pending', ?)
+                ON CONFLICT(source) WHERE status = 'pending' DO UPDATE SET
+                    error_message = excluded.error_message,
+                    retry_count = excluded.retry_count,
+                    last_try_at = excluded.last_try_at,
+                    next_retry_at = excluded.next_retry_at,
+                    updated_at = excluded.updated_at
             ''', (
                 source,
                 error_message,
                 retry_count,
                 now,
                 next_retry_at,
-                'pending',
                 now
             ))
-            return self.db.get_last_insert_id()
+            row = conn.execute('''
+                SELECT id FROM fetch_failures
+                WHERE source = ? AND status = 'pending'
+            ''', (source,)).fetchone()
+            return row['id']
     
     def mark_success(self, source: str) -> bool:
         """
@@ -164,6 +191,29 @@ class FetchFailureDAO:
         ''', (now, source))
         return updated_count > 0
 
+    def mark_success_batch(self, sources: List[str]) -> int:
+        """
+        批量标记多个数据源重试成功（单个连接、单次提交）
+        
+        Args:
+            sources: 数据源名称列表
+            
+        Returns:
+            更新的记录数
+        """
+        if not sources:
+            return 0
+        
+        now = datetime.now()
+        with self.db.get_connection() as conn:
+            cursor = conn.executemany('''
+                UPDATE fetch_failures
+                SET status = 'success',
+                    updated_at = ?
+                WHERE source = ? AND status = 'pending'
+            ''', [(now, source) for source in sources])
+            return cursor.rowcount
+
     def mark_failed(self, source: str) -> bool:
         """
         标记数据源最终失败（超过最大重试次数）
@@ -194,7 +244,7 @@ class FetchFailureDAO:
         Returns:
             失败记录，如果不存在则返回None
         """
-        row = self.db.fetch_one('''
+        row = self.db.fetch_one_row('''
             SELECT id, source, error_message, retry_count, last_try_at,
                    next_retry_at, status, created_at, updated_at
             FROM fetch_failures
@@ -207,6 +257,34 @@ class FetchFailureDAO:
             return self._row_to_failure(row)
         return None
     
+    def get_latest_by_sources(self, sources: List[str]) -> Dict[str, FetchFailure]:
+        """
+        批量获取多个数据源的最新失败记录（单次查询）
+        
+        Args:
+            sources: 数据源名称列表
+            
+        Returns:
+            数据源名称 -> 最新失败记录，无记录的数据源不出现
+        """
+        if not sources:
+            return {}
+        
+        placeholders = ','.join('?' * len(sources))
+        rows = self.db.fetch_all_rows(f'''
+            SELECT id, source, error_message, retry_count, last_try_at,
+                   next_retry_at, status, created_at, updated_at
+            FROM fetch_failures
+            WHERE source IN ({placeholders})
+            ORDER BY created_at DESC
+        ''', tuple(sources))
+        
+        result = {}
+        for row in rows:
+            failure = self._row_to_failure(row)
+            result.setdefault(failure.source, failure)
+        return result
+    
     def get_pending_failures(self) -> List[FetchFailure]:
         """
         获取所有待重试的失败记录
@@ -214,7 +292,7 @@ class FetchFailureDAO:
         Returns:
             待重试的失败记录列表
         """
-        rows = self.db.fetch_all('''
+        rows = self.db.fetch_all_rows('''
             SELECT id, source, error_message, retry_count, last_try_at,
                    next_retry_at, status, created_at, updated_at
             FROM fetch_failures
@@ -235,7 +313,7 @@ class FetchFailureDAO:
             已到重试时间的失败记录列表
         """
         now = datetime.now()
-        rows = self.db.fetch_all('''
+        rows = self.db.fetch_all_rows('''
             SELECT id, source, error_message, retry_count, last_try_at,
                    next_retry_at, status, created_at, updated_at
             FROM fetch_failures
@@ -260,7 +338,7 @@ class FetchFailureDAO:
             失败记录列表
         """
         if status:
-            rows = self.db.fetch_all('''
+            rows = self.db.fetch_all_rows('''
                 SELECT id, source, error_message, retry_count, last_try_at,
                        next_retry_at, status, created_at, updated_at
                 FROM fetch_failures
@@ -269,7 +347,7 @@ class FetchFailureDAO:
                 LIMIT ?
             ''', (status, limit))
         else:
-            rows = self.db.fetch_all('''
+            rows = self.db.fetch_all_rows('''
                 SELECT id, source, error_message, retry_count, last_try_at,
                        next_retry_at, status, created_at, updated_at
                 FROM fetch_failures
@@ -290,12 +368,21 @@ class FetchFailureDAO:
             删除的记录数
         """
         cutoff_date = datetime.now() - timedelta(days=days)
-        # self.db.execute 返回的是 rowcount (int)，不是 cursor
-        deleted_count = self.db.execute('''
-            DELETE FROM fetch_failures
-            WHERE updated_at < ?
-        ''', (cutoff_date,))
-        return deleted_count
+        deleted_count = 0
+        # 分批删除，每批单独提交，避免长时间持有写锁阻塞并发写入
+        while True:
+            # self.db.execute 返回的是 rowcount (int)，不是 cursor
+            batch_count = self.db.execute('''
+                DELETE FROM fetch_failures
+                WHERE id IN (
+                    SELECT id FROM fetch_failures
+                    WHERE updated_at < ?
+                    LIMIT ?
+                )
+            ''', (cutoff_date, self.DELETE_BATCH_SIZE))
+            deleted_count += batch_count
+            if batch_count < self.DELETE_BATCH_SIZE:
+                return deleted_count
     
     def clear_all(self) -> int:
         """
@@ -308,16 +395,17 @@ class FetchFailureDAO:
         deleted_count = self.db.execute('DELETE FROM fetch_failures')
         return deleted_count
     
-    def _row_to_failure(self, row: tuple) -> FetchFailure:
-        """将数据库行转换为 FetchFailure 对象"""
+    def _row_to_failure(self, row: sqlite3.Row) -> FetchFailure:
+        """将数据库行转换为 FetchFailure 对象（按列名读取）"""
+        status = row['status']
         return FetchFailure(
-            id=row[0],
-            source=row[1],
-            error_message=row[2],
-            retry_count=row[3] or 0,
-            last_try_at=row[4],
-            next_retry_at=row[5],
-            status=FailureStatus(row[6]) if row[6] else FailureStatus.PENDING,
-            created_at=row[7],
-            updated_at=row[8]
+            id=row['id'],
+            source=row['source'],
+            error_message=row['error_message'],
+            retry_count=row['retry_count'] or 0,
+            last_try_at=_parse_datetime(row['last_try_at']),
+            next_retry_at=_parse_datetime(row['next_retry_at']),
+            status=FailureStatus(status) if status else FailureStatus.PENDING,
+            created_at=_parse_datetime(row['created_at']),
+            updated_at=_parse_datetime(row['updated_at'])
         )
@@ -2,13 +2,57 @@
 数据模型定义
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, date
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 import json
+import sys
 
+try:
+    # orjson 为 C 扩展实现，序列化/解析速度是标准库 json 的数倍
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def json_dumps(obj: Any) -> str:
+        """序列化为 JSON 字符串（保留非 ASCII 字符）"""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj: Any) -> str:
+        """序列化为 JSON 字符串（保留非 ASCII 字符）"""
+        return json.dumps(obj, ensure_ascii=False)
+
+    json_loads = json.loads
+
+
+def _slotted_dataclass(cls):
+    """
+    生成带 __slots__ 的 dataclass（实例无 __dict__，内存占用更小、属性访问更快）
+
+    Python 3.10+ 直接使用 dataclass(slots=True)；更早版本按同样方式
+    以字段名作为 __slots__ 重建类（字段默认值已固化在生成的 __init__ 中）。
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted_dataclass
 class TrendingItem:
     """热点数据项"""
     id: Optional[int] = None
@@ -34,20 +78,22 @@ class TrendingItem:
             'author': self.author,
             'description': self.description,
             'hot_score': self.hot_score,
-            'keywords': json.dumps(self.keywords, ensure_ascii=False),
-            'extra': json.dumps(self.extra, ensure_ascii=False),
+            'keywords': json_dumps(self.keywords),
+            'extra': json_dumps(self.extra),
             'fetched_at': self.fetched_at.isoformat() if self.fetched_at else None
         }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'TrendingItem':
         """从字典创建对象"""
-        keywords = data.get('keywords', '')
-        if isinstance(keywords, str):
+        keywords = data.get('keywords')
+        if not keywords:
+            keywords = []
+        elif isinstance(keywords, str):
             if keywords.startswith('['):
                 # JSON 格式
                 try:
-                    keywords = json.loads(keywords)
+                    keywords = json_loads(keywords)
                 except:
                     keywords = []
             else:
@@ -58,11 +104,13 @@ class TrendingItem:
         if isinstance(fetched_at, str):
             fetched_at = datetime.fromisoformat(fetched_at)
         
-        # 解析 extra 字段
-        extra = data.get('extra', '{}')
-        if isinstance(extra, str):
+        # 解析 extra 字段（空值 / '{}' 直接返回空字典，省去一次 JSON 解析）
+        extra = data.get('extra')
+        if not extra or extra == '{}':
+            extra = {}
+        elif isinstance(extra, (str, bytes)):
             try:
-                extra = json.loads(extra)
+                extra = json_loads(extra)
             except:
                 extra = {}
         
@@ -81,7 +129,7 @@ class TrendingItem:
         )
 
 
-@dataclass
+@_slotted_dataclass
 class DailyStats:
     """每日统计"""
     id: Optional[int] = None
@@ -99,7 +147,7 @@ class DailyStats:
             'date': self.date.isoformat() if self.date else None,
             'source': self.source,
             'total_count': self.total_count,
-            'top_keywords': json.dumps(self.top_keywords, ensure_ascii=False),
+            'top_keywords': json_dumps(self.top_keywords),
             'avg_hot_score': self.avg_hot_score,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
@@ -107,10 +155,12 @@ class DailyStats:
     @classmethod
     def from_dict(cls, data: Dict) -> 'DailyStats':
         """从字典创建对象"""
-        top_keywords = data.get('top_keywords', '{}')
-        if isinstance(top_keywords, str):
+        top_keywords = data.get('top_keywords')
+        if not top_keywords or top_keywords == '{}':
+            top_keywords = {}
+        elif isinstance(top_keywords, (str, bytes)):
             try:
-                top_keywords = json.loads(top_keywords)
+                top_keywords = json_loads(top_keywords)
             except:
                 top_keywords = {}
         
@@ -133,7 +183,7 @@ class DailyStats:
         )
 
 
-@dataclass
+@_slotted_dataclass
 class Notification:
     """通知记录"""
     id: Optional[int] = None
@@ -157,7 +207,7 @@ class Notification:
         }
 
 
-@dataclass
+@_slotted_dataclass
 class IndexData:
     """指数行情数据（A股市场指数 + 申万行业指数）"""
     id: Optional[int] = None
@@ -2,20 +2,89 @@
 热点数据访问对象
 """
 
+import threading
+import time
 from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
 from .database import Database
-from .models import TrendingItem, DailyStats
+from .models import TrendingItem, DailyStats, json_dumps
+
+
+# 写入语句作为模块级常量复用，同一连接上 sqlite3 按 SQL 文本命中已编译语句缓存
+_UPDATE_ITEM_SQL = '''
+    UPDATE OR IGNORE trending_items SET
+        category = ?,
+        url = ?,
+        author = ?,
+        description = ?,
+        hot_score = ?,
+        keywords = ?,
+        extra = ?,
+        fetched_at = ?
+    WHERE id = ?
+'''
+
+_INSERT_ITEM_SQL = '''
+    INSERT OR IGNORE INTO trending_items
+    (source, title, category, url, author, description, hot_score, keywords, extra, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SAVE_DAILY_STATS_SQL = '''
+    INSERT OR REPLACE INTO daily_stats
+    (date, source, total_count, top_keywords, avg_hot_score)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+
+def _like_pattern(keyword: str) -> str:
+    """构造包含匹配的 LIKE 模式，转义 %、_ 及转义符本身（配合 ESCAPE '\\' 使用）"""
+    escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
 
 
 class TrendingDAO:
     """热点数据访问对象"""
     
+    # 慢变化查询（数据源列表、数据总数）的进程内 TTL 缓存，所有实例共享，
+    # 以 (数据库路径, 查询名, 参数...) 为键，本进程写入热点数据后按数据库路径失效；
+    # 其他进程的写入不会触发失效，最多滞后 _CACHE_TTL 秒
+    _CACHE_TTL = 60
+    _cache: Dict[tuple, Tuple[float, object]] = {}
+    _cache_lock = threading.Lock()
+    
     def __init__(self, db_path: Path):
         self.db = Database(db_path)
     
+    def _cache_get(self, key: tuple):
+        """读取缓存，未命中或已过期返回 None"""
+        with TrendingDAO._cache_lock:
+            entry = TrendingDAO._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() > entry[0]:
+                del TrendingDAO._cache[key]
+                return None
+            return entry[1]
+    
+    def _cache_set(self, key: tuple, value) -> None:
+        """写入缓存，同时清除已过期的条目（get_count 的键含日期，不清理会随天数持续增长）"""
+        now = time.monotonic()
+        with TrendingDAO._cache_lock:
+            cache = TrendingDAO._cache
+            for k in [k for k, entry in cache.items() if now > entry[0]]:
+                del cache[k]
+            cache[key] = (now + self._CACHE_TTL, value)
+    
+    def _invalidate_cache(self) -> None:
+        """清除当前数据库的查询缓存"""
+        db_key = str(self.db.db_path)
+        with TrendingDAO._cache_lock:
+            for key in [k for k in TrendingDAO._cache if k[0] == db_key]:
+                del TrendingDAO._cache[key]
+    
     def save_items(self, items: List[TrendingItem]) -> int:
         """
         批量保存热点数据（已存在的会更新）
@@ -33,73 +102,79 @@ class TrendingDAO:
         if not items:
             return 0
 
-        import json
-        from datetime import date
-
-        saved_count = 0
-        updated_count = 0
+        now = datetime.now()
+        dumps = json_dumps
 
+        # 先在内存中按 (source, title, fetched_date) 去重，同一批次中后出现的数据覆盖先出现的
+        pending: Dict[Tuple[str, str, str], tuple] = {}
+        duplicate_count = 0
+        invalid_count = 0
         for item in items:
-            try:
-                # 确保 fetched_at 有值
-                fetched_at = item.fetched_at or datetime.now()
-                fetched_date = fetched_at.date().isoformat()
-
-                # 先尝试查找是否存在相同记录（基于 source + title + fetched_date）
-                existing = self.db.fetch_one('''
-                    SELECT id FROM trending_items
-                    WHERE source = ? AND title = ? AND fetched_date = ?
-                ''', (item.source, item.title, fetched_date))
-
-                if existing:
-                    # 更新现有记录
-                    self.db.execute('''
-                        UPDATE trending_items SET
-                            category = ?,
-                            url = ?,
-                            author = ?,
-                            description = ?,
-                            hot_score = ?,
-                            keywords = ?,
-                            extra = ?,
-                            fetched_at = ?
-                        WHERE id = ?
-                    ''', (
-                        item.category,
-                        item.url,
-                        item.author,
-                        item.description,
-                        item.hot_score,
-                        ','.join(item.keywords) if item.keywords else '',
-                        json.dumps(item.extra, ensure_ascii=False) if item.extra else '{}',
-                        fetched_at,
-                        existing['id']
-                    ))
-                    updated_count += 1
-                else:
-                    # 插入新记录
-                    self.db.execute('''
-                        INSERT INTO trending_items
-                        (source, category, title, url, author, description, hot_score, keywords, extra, fetched_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        item.source,
-                        item.category,
-                        item.title,
-                        item.url,
-                        item.author,
-                        item.description,
-                        item.hot_score,
-                        ','.join(item.keywords) if item.keywords else '',
-                        json.dumps(item.extra, ensure_ascii=False) if item.extra else '{}',
-                        fetched_at
-                    ))
-                    saved_count += 1
-
-            except Exception as e:
-                # 记录错误但继续处理其他数据
-                print(f"保存数据失败: {e}, source={item.source}, title={item.title[:30] if item.title else 'N/A'}")
+            # 缺少标题或链接的数据无法去重，直接跳过
+            if not item.title or not item.url:
+                invalid_count += 1
                 continue
+            # 确保 fetched_at 有值
+            fetched_at = item.fetched_at or now
+            key = (item.source, item.title, fetched_at.date().isoformat())
+            if key in pending:
+                duplicate_count += 1
+            pending[key] = (
+                item.category,
+                item.url,
+                item.author,
+                item.description,
+                item.hot_score,
+                ','.join(item.keywords) if item.keywords else '',
+                dumps(item.extra) if item.extra else '{}',
+                fetched_at
+            )
+
+        if invalid_count:
+            print(f"保存数据跳过: {invalid_count} 条缺少标题或链接")
+        if not pending:
+            return 0
+
+        sources = {key[0] for key in pending}
+        dates = {key[2] for key in pending}
+
+        with self.db.get_connection() as conn:
+            # 一次查询取回本批次涉及的数据源和日期下已存在的记录
+            existing_rows = conn.execute(f'''
+                SELECT id, source, title, fetched_date FROM trending_items
+                WHERE source IN ({','.join('?' * len(sources))})
+                  AND fetched_date IN ({','.join('?' * len(dates))})
+            ''', (*sources, *dates)).fetchall()
+            existing = {
+                (row['source'], row['title'], row['fetched_date']): row['id']
+                for row in existing_rows
+            }
+
+            update_rows = []
+            insert_rows = []
+            for key, values in pending.items():
+                row_id = existing.get(key)
+                if row_id is not None:
+                    update_rows.append((*values, row_id))
+                else:
+                    insert_rows.append((key[0], key[1], *values))
+
+            # 批量更新/插入（与 url 唯一约束冲突的数据跳过，不影响同批次其他数据）
+            updated_count = 0
+            if update_rows:
+                updated_count = conn.executemany(_UPDATE_ITEM_SQL, update_rows).rowcount
+
+            saved_count = 0
+            if insert_rows:
+                saved_count = conn.executemany(_INSERT_ITEM_SQL, insert_rows).rowcount
+
+        self._invalidate_cache()
+
+        # 同批次内的重复数据按逐条保存的语义计为一次更新
+        updated_count += duplicate_count
+        skipped = len(pending) - saved_count - (updated_count - duplicate_count)
+        if skipped > 0:
+            print(f"保存数据失败: {skipped} 条与已有记录的链接冲突，已跳过")
 
         total = saved_count + updated_count
         if updated_count > 0:
@@ -152,16 +227,17 @@ class TrendingDAO:
             params.append(source)
         
         if start_date:
-            conditions.append("DATE(fetched_at) >= ?")
+            conditions.append("fetched_date >= ?")
             params.append(start_date.isoformat())
         
         if end_date:
-            conditions.append("DATE(fetched_at) <= ?")
+            conditions.append("fetched_date <= ?")
             params.append(end_date.isoformat())
         
         if keyword:
-            conditions.append("(title LIKE ? OR description LIKE ?)")
-            params.extend([f"%{keyword}%", f"%{keyword}%"])
+            pattern = _like_pattern(keyword)
+            conditions.append("(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+            params.extend([pattern, pattern])
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         
@@ -174,8 +250,77 @@ class TrendingDAO:
         params.append(limit)
         
         rows = self.db.fetch_all(sql, tuple(params))
-        return [TrendingItem.from_dict(row) for row in rows]
+        return list(map(TrendingItem.from_dict, rows))
     
+    def get_items_by_keywords(
+        self,
+        keywords: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit_per_keyword: int = 1000
+    ) -> Dict[str, List[TrendingItem]]:
+        """
+        单次查询获取多个关键词的匹配数据（匹配规则与 get_items 的 keyword 一致）
+
+        Args:
+            keywords: 关键词列表
+            start_date: 开始日期
+            end_date: 结束日期
+            limit_per_keyword: 每个关键词最多返回的条数（按抓取时间倒序）
+
+        Returns:
+            {keyword: [TrendingItem, ...]} 字典
+        """
+        result: Dict[str, List[TrendingItem]] = {kw: [] for kw in keywords}
+        if not keywords:
+            return result
+        unique_keywords = list(result)
+
+        date_conditions = []
+        date_params = []
+
+        if start_date:
+            date_conditions.append("fetched_date >= ?")
+            date_params.append(start_date.isoformat())
+
+        if end_date:
+            date_conditions.append("fetched_date <= ?")
+            date_params.append(end_date.isoformat())
+
+        # 每个关键词一个带 LIMIT 的子查询（与 get_items 的 keyword 查询相同），
+        # UNION ALL 后一次性取回完整记录，数据库只返回每个关键词的前 N 条
+        where_clause = " AND ".join(
+            date_conditions + ["(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')"]
+        )
+        subqueries = []
+        params = []
+        for idx, kw in enumerate(unique_keywords):
+            pattern = _like_pattern(kw)
+            subqueries.append(f'''
+                SELECT * FROM (
+                    SELECT {idx} AS kw_idx, id, fetched_at FROM trending_items
+                    WHERE {where_clause}
+                    ORDER BY fetched_at DESC
+                    LIMIT ?
+                )''')
+            params.extend([*date_params, pattern, pattern, limit_per_keyword])
+
+        rows = self.db.fetch_all(f'''
+            SELECT m.kw_idx, t.* FROM ({" UNION ALL ".join(subqueries)}) AS m
+            JOIN trending_items AS t ON t.id = m.id
+            ORDER BY m.kw_idx, m.fetched_at DESC
+        ''', tuple(params))
+
+        # 同一条记录匹配多个关键词时共用同一个 TrendingItem 对象
+        items_by_id: Dict[int, TrendingItem] = {}
+        for row in rows:
+            item = items_by_id.get(row['id'])
+            if item is None:
+                item = items_by_id[row['id']] = TrendingItem.from_dict(row)
+            result[unique_keywords[row['kw_idx']]].append(item)
+
+        return result
+
     def get_item_by_id(self, item_id: int) -> Optional[TrendingItem]:
         """根据ID获取热点数据"""
         row = self.db.fetch_one(
@@ -215,16 +360,12 @@ class TrendingDAO:
                 ORDER BY date DESC
             ''', (start_date.isoformat(), end_date.isoformat()))
         
-        return [DailyStats.from_dict(row) for row in rows]
+        return list(map(DailyStats.from_dict, rows))
     
     def save_daily_stats(self, stats: DailyStats) -> bool:
         """保存每日统计"""
         try:
-            self.db.execute('''
-                INSERT OR REPLACE INTO daily_stats
-                (date, source, total_count, top_keywords, avg_hot_score)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
+            self.db.execute(_SAVE_DAILY_STATS_SQL, (
                 stats.date.isoformat(),
                 stats.source,
                 stats.total_count,
@@ -252,34 +393,24 @@ class TrendingDAO:
         """
         start_date = date.today() - timedelta(days=days)
         
-        # 获取所有关键词
-        rows = self.db.fetch_all('''
-            SELECT keywords FROM trending_items
-            WHERE DATE(fetched_at) >= ? AND keywords IS NOT NULL AND keywords != ''
-        ''', (start_date.isoformat(),))
-        
-        # 统计词频
-        keyword_counts = {}
-        for row in rows:
-            keywords_str = row.get('keywords', '')
-            if keywords_str:
-                keywords = keywords_str.split(',')
-                for kw in keywords:
-                    kw = kw.strip()
-                    if kw:
-                        keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
-        
-        # 排序并返回前N个
-        sorted_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
-        
-        return [
-            {'keyword': kw, 'count': count}
-            for kw, count in sorted_keywords
-        ]
+        # 在 SQL 内用递归 CTE 拆分逗号分隔的关键词并计数，只把前N个结果取回 Python；
+        # 同频次按首次出现的记录排序
+        return self.db.fetch_all('''
+            WITH RECURSIVE split(id, kw, rest) AS (
+                SELECT id, '', keywords || ',' FROM trending_items
+                WHERE fetched_date >= ? AND keywords IS NOT NULL AND keywords != ''
+                UNION ALL
+                SELECT id,
+                       trim(substr(rest, 1, instr(rest, ',') - 1), ' ' || char(9, 10, 13)),
+                       substr(rest, instr(rest, ',') + 1)
+                FROM split WHERE rest != ''
+            )
+            SELECT kw AS keyword, COUNT(*) AS count FROM split
+            WHERE kw != ''
+            GROUP BY kw
+            ORDER BY count DESC, MIN(id)
+            LIMIT ?
+        ''', (start_date.isoformat(), top_n))
     
     def delete_old_data(self, days: int = 30) -> int:
         """
@@ -291,28 +422,42 @@ class TrendingDAO:
         Returns:
             删除的数据条数
         """
-        cutoff_date = date.today() - timedelta(days=days)
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+        
+        with self.db.get_connection() as conn:
+            # 删除旧的热点数据
+            deleted_items = conn.execute(
+                'DELETE FROM trending_items WHERE fetched_date < ?',
+                (cutoff,)
+            ).rowcount
+            
+            # 删除旧的统计数据
+            deleted_stats = conn.execute(
+                'DELETE FROM daily_stats WHERE date < ?',
+                (cutoff,)
+            ).rowcount
         
-        # 删除旧的热点数据
-        deleted_items = self.db.execute(
-            'DELETE FROM trending_items WHERE DATE(fetched_at) < ?',
-            (cutoff_date.isoformat(),)
-        )
-        
-        # 删除旧的统计数据
-        deleted_stats = self.db.execute(
-            'DELETE FROM daily_stats WHERE date < ?',
-            (cutoff_date.isoformat(),)
-        )
+        if deleted_items:
+            self._invalidate_cache()
         
         return deleted_items + deleted_stats
     
     def get_sources(self) -> List[str]:
-        """获取所有数据源列表"""
-        rows = self.db.fetch_all(
-            'SELECT DISTINCT source FROM trending_items ORDER BY source'
-        )
-        return [row['source'] for row in rows]
+        """
+        获取所有数据源列表
+
+        结果缓存 _CACHE_TTL 秒，本进程写入后立即失效；
+        其他进程（如独立运行的调度器）写入的新数据源最多延迟 _CACHE_TTL 秒可见
+        """
+        cache_key = (str(self.db.db_path), 'sources')
+        sources = self._cache_get(cache_key)
+        if sources is None:
+            rows = self.db.fetch_all_rows(
+                'SELECT DISTINCT source FROM trending_items ORDER BY source'
+            )
+            sources = tuple(row['source'] for row in rows)
+            self._cache_set(cache_key, sources)
+        return list(sources)
 
     def get_latest_fetch_time(self, source: Optional[str] = None) -> Optional[datetime]:
         """
@@ -370,7 +515,17 @@ class TrendingDAO:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> int:
-        """获取数据总数"""
+        """
+        获取数据总数
+
+        结果按查询条件缓存 _CACHE_TTL 秒，本进程写入后立即失效；
+        其他进程写入的数据最多延迟 _CACHE_TTL 秒计入
+        """
+        cache_key = (str(self.db.db_path), 'count', source, start_date, end_date)
+        count = self._cache_get(cache_key)
+        if count is not None:
+            return count
+        
         conditions = []
         params = []
         
@@ -379,11 +534,11 @@ class TrendingDAO:
             params.append(source)
         
         if start_date:
-            conditions.append("DATE(fetched_at) >= ?")
+            conditions.append("fetched_date >= ?")
             params.append(start_date.isoformat())
         
         if end_date:
-            conditions.append("DATE(fetched_at) <= ?")
+            conditions.append("fetched_date <= ?")
             params.append(end_date.isoformat())
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
@@ -392,8 +547,71 @@ class TrendingDAO:
             f'SELECT COUNT(*) as count FROM trending_items WHERE {where_clause}',
             tuple(params)
         )
-        return row['count'] if row else 0
+        count = row['count'] if row else 0
+        self._cache_set(cache_key, count)
+        return count
     
+    def get_daily_counts(
+        self,
+        start_date: date,
+        end_date: date,
+        source: Optional[str] = None
+    ) -> List[Tuple[date, int]]:
+        """
+        按日期分组统计数据量（单次查询）
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+            source: 数据源（可选）
+
+        Returns:
+            按日期升序的 (date, count) 列表，无数据的日期不出现
+        """
+        conditions = ["fetched_date >= ?", "fetched_date <= ?"]
+        params = [start_date.isoformat(), end_date.isoformat()]
+
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+
+        rows = self.db.fetch_all(f'''
+            SELECT fetched_date as day, COUNT(*) as count
+            FROM trending_items
+            WHERE {" AND ".join(conditions)}
+            GROUP BY fetched_date
+            ORDER BY day
+        ''', tuple(params))
+
+        return [(date.fromisoformat(row['day']), row['count']) for row in rows]
+
+    def get_counts_by_source_and_day(
+        self,
+        start_date: date,
+        end_date: date
+    ) -> Dict[str, Dict[date, int]]:
+        """
+        按数据源和日期分组统计数据量（单次查询）
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            {source: {date: count}} 字典，无数据的日期不出现
+        """
+        rows = self.db.fetch_all('''
+            SELECT source, fetched_date as day, COUNT(*) as count
+            FROM trending_items
+            WHERE fetched_date >= ? AND fetched_date <= ?
+            GROUP BY source, fetched_date
+        ''', (start_date.isoformat(), end_date.isoformat()))
+
+        result: Dict[str, Dict[date, int]] = {}
+        for row in rows:
+            result.setdefault(row['source'], {})[date.fromisoformat(row['day'])] = row['count']
+        return result
+
     def get_hourly_distribution(
         self,
         days: int = 1,
@@ -420,7 +638,7 @@ class TrendingDAO:
         
         where_clause = " AND ".join(conditions)
         
-        rows = self.db.fetch_all(f'''
+        rows = self.db.fetch_all_rows(f'''
             SELECT 
                 CAST(strftime('%H', fetched_at) AS INTEGER) as hour,
                 COUNT(*) as count,
@@ -432,17 +650,18 @@ class TrendingDAO:
             ORDER BY hour
         ''', tuple(params))
         
-        # 转换为24小时格式，没有数据的小时填充0
-        result = []
+        # 转换为24小时格式，没有数据的小时填充0（SQL 已聚合，最多 24 行）
         hour_map = {row['hour']: row for row in rows}
+        result = []
         
         for hour in range(24):
-            if hour in hour_map:
+            row = hour_map.get(hour)
+            if row is not None:
                 result.append({
                     'hour': hour,
-                    'count': hour_map[hour]['count'],
-                    'avg_hot_score': round(hour_map[hour]['avg_hot_score'] or 0, 2),
-                    'total_hot_score': round(hour_map[hour]['total_hot_score'] or 0, 2)
+                    'count': row['count'],
+                    'avg_hot_score': round(row['avg_hot_score'] or 0, 2),
+                    'total_hot_score': round(row['total_hot_score'] or 0, 2)
                 })
             else:
                 result.append({
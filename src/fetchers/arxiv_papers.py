@@ -14,14 +14,15 @@ if hasattr(sys.stdout, 'buffer') and not sys.stdout.closed:
         pass
 
 import requests
-import re
 import time
-from typing import List, Dict
+from typing import BinaryIO, List, Dict
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import quote
 import threading
 
+from lxml import etree
+
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -30,6 +31,10 @@ from src.utils import get_logger, save_json
 from .base import BaseFetcher, TrendingItem
 
 
+# arXiv API 返回 Atom 格式，元素都在该命名空间下
+ATOM = '{http://www.w3.org/2005/Atom}'
+
+
 class ArxivPapersFetcher(BaseFetcher):
     """arXiv论文数据获取器"""
 
@@ -86,10 +91,11 @@ class ArxivPapersFetcher(BaseFetcher):
             # 等待以满足 arXiv API 频率限制
             self._wait_for_rate_limit()
 
-            response = self.session.get(self.base_url, params=params, timeout=15)
-            response.raise_for_status()
-
-            items = self._parse_response(response.text)
+            # 流式读取响应体，边下载边解析，不再整体解码为 str
+            with self.session.get(self.base_url, params=params, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                items = self._parse_response(response.raw)
             self.logger.info(f"arXiv: 获取 {len(items)} 条数据")
             return items
 
@@ -97,72 +103,77 @@ class ArxivPapersFetcher(BaseFetcher):
             self.logger.error(f"获取arXiv论文失败: {e}")
             return []
 
-    def _parse_response(self, xml_text: str) -> List[TrendingItem]:
-        """解析arXiv API响应"""
+    def _parse_response(self, source: BinaryIO) -> List[TrendingItem]:
+        """
+        解析arXiv API响应（流式解析 Atom entry，逐条释放已处理的节点）
+
+        Args:
+            source: 二进制可读对象（如流式响应的 response.raw）
+        """
         items = []
 
-        # 使用正则表达式提取论文信息
-        entries = re.findall(r'<entry>(.*?)</entry>', xml_text, re.DOTALL)
-
-        for entry in entries:
-            try:
-                # 提取ID
-                id_match = re.search(r'<id>(.*?)</id>', entry)
-                paper_id = id_match.group(1).split('/')[-1] if id_match else ''
-
-                # 提取标题
-                title_match = re.search(r'<title>(.*?)</title>', entry, re.DOTALL)
-                title = title_match.group(1).strip().replace('\n', ' ') if title_match else ''
-
-                # 提取摘要
-                summary_match = re.search(r'<summary>(.*?)</summary>', entry, re.DOTALL)
-                summary = summary_match.group(1).strip().replace('\n', ' ') if summary_match else ''
-
-                # 提取作者
-                authors = []
-                author_matches = re.findall(r'<name>(.*?)</name>', entry)
-                for author in author_matches:
-                    authors.append(author.strip())
-
-                # 提取发布日期
-                published_match = re.search(r'<published>(.*?)</published>', entry)
-                published = published_match.group(1) if published_match else ''
-
-                # 提取更新日期
-                updated_match = re.search(r'<updated>(.*?)</updated>', entry)
-                updated = updated_match.group(1) if updated_match else ''
-
-                # 提取分类
-                category_match = re.search(r'<category term="(.*?)"', entry)
-                category = category_match.group(1) if category_match else ''
-
-                # 构建URL
-                url = f"https://arxiv.org/abs/{paper_id}"
-
-                item = TrendingItem(
-                    source=self.name,
-                    title=title,
-                    url=url,
-                    author=', '.join(authors[:3]) if authors else None,  # 只取前3个作者
-                    description=summary,  # 完整描述
-                    hot_score=None,  # arXiv 没有热度分数
-                    category=category,
-                    extra={
-                        'paper_id': paper_id,
-                        'authors': authors,
-                        'published': published,
-                        'updated': updated,
-                        'category': category
-                    }
-                )
-                items.append(item)
-
-            except Exception as e:
-                self.logger.warning(f"解析论文失败: {e}")
-                continue
+        context = etree.iterparse(source, events=('end',), tag=f'{ATOM}entry')
+        try:
+            for _, entry in context:
+                try:
+                    items.append(self._parse_entry(entry))
+                except Exception as e:
+                    self.logger.warning(f"解析论文失败: {e}")
+                finally:
+                    # 释放已处理的节点，保持内存占用恒定
+                    entry.clear()
+                    while entry.getprevious() is not None:
+                        del entry.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            self.logger.warning(f"arXiv 响应 XML 解析中断: {e}")
+        finally:
+            del context
 
         return items
 
+    def _parse_entry(self, entry) -> TrendingItem:
+        """将单个 Atom entry 元素转换为 TrendingItem"""
+        # 提取ID
+        paper_id = (entry.findtext(f'{ATOM}id') or '').strip().split('/')[-1]
+
+        # 提取标题和摘要
+        title = (entry.findtext(f'{ATOM}title') or '').strip().replace('\n', ' ')
+        summary = (entry.findtext(f'{ATOM}summary') or '').strip().replace('\n', ' ')
+
+        # 提取作者
+        authors = [
+            (name.text or '').strip()
+            for name in entry.iterfind(f'{ATOM}author/{ATOM}name')
+        ]
+
+        # 提取发布/更新日期
+        published = entry.findtext(f'{ATOM}published') or ''
+        updated = entry.findtext(f'{ATOM}updated') or ''
+
+        # 提取分类
+        category_el = entry.find(f'{ATOM}category')
+        category = category_el.get('term', '') if category_el is not None else ''
+
+        # 构建URL
+        url = f"https://arxiv.org/abs/{paper_id}"
+
+        return TrendingItem(
+            source=self.name,
+            title=title,
+            url=url,
+            author=', '.join(authors[:3]) if authors else None,  # 只取前3个作者
+            description=summary,  # 完整描述
+            hot_score=None,  # arXiv 没有热度分数
+            category=category,
+            extra={
+                'paper_id': paper_id,
+                'authors': authors,
+                'published': published,
+                'updated': updated,
+                'category': category
+            }
+        )
+
     def fetch_papers(self, categories: List[str] = None, limit: int = None) -> List[Dict]:
         """
         获取arXiv论文（旧接口，保留兼容性）
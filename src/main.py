@@ -30,6 +30,8 @@ class TrendingService:
         self.port = port or SERVER['port']
         self.debug = debug
         self.pid_file = pid_file
+        # 停止请求文件（Windows 下 stop_service 写入该文件请求正常停止）
+        self.stop_file = str(Path(pid_file).with_suffix('.stop')) if pid_file else None
         self.logger = None
         self.server = None
         self.scheduler = None
@@ -119,6 +121,10 @@ class TrendingService:
 
             threading.Thread(target=fetch_initial_data, daemon=True).start()
 
+            # 清理上次运行遗留的停止请求
+            if self.stop_file and os.path.exists(self.stop_file):
+                os.remove(self.stop_file)
+
             # 写入PID文件
             if self.pid_file:
                 try:
@@ -168,8 +174,16 @@ class TrendingService:
         self.logger.info("🎯 Trending Service 已完全停止")
 
     def _keep_running(self):
-        """保持服务运行"""
+        """保持服务运行（每秒检查一次停止请求文件）"""
         while self.running:
+            if self.stop_file and os.path.exists(self.stop_file):
+                self.logger.info("🛑 收到停止请求...")
+                try:
+                    os.remove(self.stop_file)
+                except OSError:
+                    pass
+                self.stop()
+                break
             time.sleep(1)
 
     def run_task_now(self, task_name: str):
@@ -225,6 +239,9 @@ def main():
     # 设置信号处理器
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    if hasattr(signal, 'SIGBREAK'):
+        # Windows 控制台中按 Ctrl+Break 时正常停止（后台运行时由停止请求文件触发）
+        signal.signal(signal.SIGBREAK, signal_handler)
 
     if args.status:
         # 查看服务状态
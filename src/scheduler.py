@@ -19,10 +19,10 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.config import SCHEDULE, DATA_SOURCES, REPORTS_DIR, BROWSER, SERVER, DATABASE, is_time_to_run
+from src.config import SCHEDULE, ENABLED_SOURCE_NAMES, REPORTS_DIR, BROWSER, SERVER, DATABASE, is_time_to_run
 from src.utils import get_logger, ReportGenerator
 from src.utils.retry_manager import RetryManager, FetchResult, FetchStatus, RetryConfig
-from src.db import TrendingDAO, FetchFailureDAO
+from src.db import TrendingDAO, FetchFailureDAO, FailureStatus
 from src.fetchers import get_fetcher_class
 
 _FETCHER_METHOD_MAP = {
@@ -39,6 +39,15 @@ _FETCHER_METHOD_MAP = {
 }
 
 
+# 启用数据源的集合，用于单次哈希查找判断是否启用
+_ENABLED_SOURCES = frozenset(ENABLED_SOURCE_NAMES)
+
+
+def _is_source_enabled(source: str) -> bool:
+    """判断数据源是否启用（github_ai 跟随 github 的开关）"""
+    return ('github' if source == 'github_ai' else source) in _ENABLED_SOURCES
+
+
 class TaskScheduler:
     """定时任务调度器"""
 
@@ -96,6 +105,11 @@ class TaskScheduler:
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
 
+        # 关闭关键词提取的共享进程池（仅在关键词模块已加载时，避免停止时才导入 jieba）
+        keywords_module = sys.modules.get('src.analytics.keywords')
+        if keywords_module is not None:
+            keywords_module.close_shared_extractors()
+
         self.logger.info("定时任务调度器已停止")
 
     def _run_scheduler(self):
@@ -186,10 +200,7 @@ class TrendingTaskScheduler(TaskScheduler):
 
     def _register_fetchers(self):
         for source in _FETCHER_METHOD_MAP:
-            if source == 'github_ai':
-                if not DATA_SOURCES.get('github', {}).get('enabled'):
-                    continue
-            elif not DATA_SOURCES.get(source, {}).get('enabled'):
+            if not _is_source_enabled(source):
                 continue
 
             method_name = _FETCHER_METHOD_MAP[source]
@@ -329,13 +340,9 @@ class TrendingTaskScheduler(TaskScheduler):
             ('aihot', "🔥 获取 AIHOT..."),
         ]
 
-        enabled_sources = []
-        for source, message in source_order:
-            if source == 'github_ai':
-                if DATA_SOURCES.get('github', {}).get('enabled'):
-                    enabled_sources.append((source, message))
-            elif DATA_SOURCES.get(source, {}).get('enabled'):
-                enabled_sources.append((source, message))
+        enabled_sources = [
+            (source, message) for source, message in source_order if _is_source_enabled(source)
+        ]
 
         all_items = []
         fetch_results = []
@@ -441,9 +448,10 @@ class TrendingTaskScheduler(TaskScheduler):
         self.logger.info("开始刷新数据...")
 
         all_items = []
+        refreshed_sources = []
 
         if sources is None:
-            sources = [name for name, config in DATA_SOURCES.items() if config.get('enabled')]
+            sources = list(ENABLED_SOURCE_NAMES)
             if 'github' in sources and 'github_ai' not in sources:
                 sources.append('github_ai')
 
@@ -452,12 +460,9 @@ class TrendingTaskScheduler(TaskScheduler):
                 self.logger.warning(f"⚠️  未知的数据源: {source}")
                 continue
 
-            if source == 'github_ai':
-                if not DATA_SOURCES.get('github', {}).get('enabled'):
-                    self.logger.info(f"⏭️  跳过 {source} (GitHub 未启用)")
-                    continue
-            elif not DATA_SOURCES.get(source, {}).get('enabled'):
-                self.logger.info(f"⏭️  跳过 {source} (未启用)")
+            if not _is_source_enabled(source):
+                reason = 'GitHub 未启用' if source == 'github_ai' else '未启用'
+                self.logger.info(f"⏭️  跳过 {source} ({reason})")
                 continue
 
             try:
@@ -468,11 +473,16 @@ class TrendingTaskScheduler(TaskScheduler):
                 items = getattr(fetcher, method_name)()
                 all_items.extend(items)
                 self.logger.info(f"✅ {source} 数据刷新完成: {len(items)} 条")
-                
-                self.failure_dao.mark_success(source)
+                refreshed_sources.append(source)
             except Exception as e:
                 self.logger.error(f"❌ 刷新 {source} 数据失败: {e}")
 
+        # 刷新成功的数据源统一在一个事务中清除待重试状态
+        try:
+            self.failure_dao.mark_success_batch(refreshed_sources)
+        except Exception as e:
+            self.logger.error(f"更新失败记录状态失败: {e}")
+
         if all_items:
             self.logger.info("🔍 提取关键词...")
             from src.analytics import extract_keywords_for_items
@@ -496,14 +506,16 @@ class TrendingTaskScheduler(TaskScheduler):
     def get_fetch_status(self) -> Dict[str, Dict]:
         status = {}
         
+        # 重试管理器在内存中维护各数据源的最新结果，仅对尚无结果的数据源一次性查询失败记录
         results = self.retry_manager.get_all_results()
+        enabled_sources = ENABLED_SOURCE_NAMES
+        failures = self.failure_dao.get_latest_by_sources(
+            [source for source in enabled_sources if source not in results]
+        )
         
-        for source in DATA_SOURCES.keys():
-            if not DATA_SOURCES[source].get('enabled'):
-                continue
-                
+        for source in enabled_sources:
             result = results.get(source)
-            failure = self.failure_dao.get_by_source(source)
+            failure = failures.get(source)
             
             if result:
                 status[source] = {
@@ -516,12 +528,12 @@ class TrendingTaskScheduler(TaskScheduler):
                 }
             elif failure:
                 status[source] = {
-                    'success': failure.status == 'success',
+                    'success': failure.status == FailureStatus.SUCCESS,
                     'item_count': 0,
                     'last_update': failure.last_try_at.isoformat() if failure.last_try_at else None,
                     'error_message': failure.error_message,
                     'retry_count': failure.retry_count,
-                    'status': failure.status
+                    'status': failure.status.value
                 }
             else:
                 status[source] = {
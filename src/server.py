@@ -8,9 +8,10 @@ import threading
 import time
 import json
 import hashlib
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根目录到 Python 路径
 project_root = Path(__file__).parent.parent
@@ -18,8 +19,46 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from flask import Flask, jsonify, send_from_directory, redirect, Response, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.serving import WSGIRequestHandler
 from src.config import SERVER, REPORTS_DIR, ROUTES, DATABASE, ConfigHotReloader
+from src.db import Database, TrendingDAO, IndexDAO
 from src.utils import get_logger
+from src.utils.crossover import refresh_all_crossovers, get_cached_crossover, detect_crossover_history
+
+try:
+    # orjson 为 C 扩展实现，序列化速度是标准库 json 的数倍，且直接输出 UTF-8 字节
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """基于 orjson 的 JSON 序列化（仅在安装了 orjson 时启用）"""
+
+    # 与 Flask 默认行为保持一致：键排序、允许非字符串键，日期时间仍交给 default 格式化；
+    # numpy 标量/数组（如 akshare 行情数据）由 orjson 原生序列化，标准库 json 可直接处理 numpy 浮点数
+    OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_SERIALIZE_NUMPY
+        if orjson else 0
+    )
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            # 需要缩进等标准库参数时回退到默认实现
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode('utf-8')
+
+    def response(self, *args, **kwargs) -> Response:
+        if self.compact is False or (self.compact is None and self._app.debug):
+            # 调试模式下保留默认的缩进输出
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        payload = orjson.dumps(
+            obj, default=self.default, option=self.OPTIONS | orjson.OPT_APPEND_NEWLINE
+        )
+        return self._app.response_class(payload, mimetype=self.mimetype)
 
 
 class TTLCache:
@@ -58,9 +97,18 @@ class TTLCache:
                 del self._store[k]
 
 
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    """使用 HTTP/1.1 处理请求，支持 keep-alive，前端轮询时可复用 TCP 连接"""
+    protocol_version = 'HTTP/1.1'
+
+
 # 全局缓存实例
 _api_cache = TTLCache()
 
+# 支持单独刷新的数据源
+REFRESHABLE_SOURCES = ('github', 'github_ai', 'bilibili', 'arxiv',
+                       'hackernews', 'zhihu', 'weibo', 'douyin', 'aihot')
+
 
 def cached(ttl_seconds=30, key_prefix=''):
     """
@@ -106,11 +154,13 @@ class TrendingServer:
         self.server_thread = None
         self.running = False
         self.config_watcher = ConfigHotReloader(interval=2.0)
+        # 全量刷新串行执行：同一时间最多一个刷新任务，并发请求复用进行中的任务结果
+        self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='refresh')
+        self._refresh_future = None
+        self._refresh_lock = threading.Lock()
 
         # 启动时预热金叉信号内存缓存（后台预计算，避免影响 API 响应时间）
         try:
-            from src.utils.crossover import refresh_all_crossovers
-            from src.db.index_dao import IndexDAO
             dao = IndexDAO(DATABASE['path'])
             refresh_all_crossovers(dao, logger=self.logger)
         except Exception as e:
@@ -122,12 +172,21 @@ class TrendingServer:
                     static_folder=str(project_root / 'static'),
                     template_folder=str(project_root / 'templates'))
         
+        # 安装了 orjson 时用其替换默认的 JSON 序列化
+        if orjson is not None:
+            app.json = OrjsonProvider(app)
+        
         # 配置日志
         app.logger.handlers = []
         for handler in self.logger.handlers:
             app.logger.addHandler(handler)
         app.logger.setLevel(self.logger.level)
 
+        # Werkzeug threaded 模式下每个请求在新线程中处理，请求结束时释放该线程的数据库连接
+        @app.teardown_request
+        def _close_db_connections(exc):
+            Database.close_thread_connections()
+
         # 注册路由
         self._register_routes(app)
         
@@ -142,9 +201,6 @@ class TrendingServer:
         def api_index_market():
             """A股市场指数列表（含金叉信号，从内存缓存读取）"""
             try:
-                from src.db.index_dao import IndexDAO
-                from src.utils.crossover import get_cached_crossover
-
                 dao = IndexDAO(DATABASE['path'])
                 indices = dao.get_market_indices(limit=50)
 
@@ -171,10 +227,6 @@ class TrendingServer:
         def api_index_industry():
             """申万行业指数列表（含 3日/7日 涨跌幅、金叉信号，60s 缓存）"""
             try:
-                from src.db.index_dao import IndexDAO
-                from src.utils.crossover import get_cached_crossover
-                from flask import request
-
                 try:
                     limit = min(int(request.args.get('limit', 500)), 1000)
                 except (ValueError, TypeError):
@@ -215,9 +267,6 @@ class TrendingServer:
         def api_index_latest():
             """最新指数数据（可选 category 参数: market/industry）"""
             try:
-                from src.db.index_dao import IndexDAO
-                from flask import request
-
                 category = request.args.get('category')
                 try:
                     limit = min(int(request.args.get('limit', 50)), 200)
@@ -243,9 +292,6 @@ class TrendingServer:
         def api_index_detail():
             """指数历史数据（按代码查询）"""
             try:
-                from src.db.index_dao import IndexDAO
-                from flask import request
-
                 code = request.args.get('code')
                 if not code:
                     return jsonify({'success': False, 'error': '缺少指数代码参数: code'}), 400
@@ -286,9 +332,6 @@ class TrendingServer:
             """
             try:
                 from src.fetchers.index import IndexFetcher
-                from src.db.index_dao import IndexDAO
-                from flask import request
-                from datetime import datetime, timedelta
 
                 code = request.args.get('code')
                 if not code:
@@ -364,7 +407,6 @@ class TrendingServer:
                     # 3. 如果缓存有效，直接返回
                     if cached and not need_refresh:
                         # 计算金叉标记点
-                        from src.utils.crossover import detect_crossover_history
                         closes = [k['close'] for k in cached]
                         dates = [k['date'] for k in cached]
                         crossover_points = detect_crossover_history(closes, dates)
@@ -392,7 +434,6 @@ class TrendingServer:
                         self.logger.warning(f"K线数据缓存失败: {e}")
 
                 # 计算金叉标记点
-                from src.utils.crossover import detect_crossover_history
                 closes = [k['close'] for k in kline]
                 dates = [k['date'] for k in kline]
                 crossover_points = detect_crossover_history(closes, dates)
@@ -421,8 +462,6 @@ class TrendingServer:
             用于前端展示强势/弱势排名表、热力图、轮动趋势。
             """
             try:
-                from src.db.index_dao import IndexDAO
-
                 # 缓存检查（60s TTL）
                 cache_key = "rotation:all"
                 cached = _api_cache.get(cache_key)
@@ -509,7 +548,6 @@ class TrendingServer:
             """主力资金行业净流入排行（双向条形图数据源）"""
             try:
                 from src.fetchers.fund_flow import fetch_sector_fund_flow
-                from flask import request
 
                 indicator = request.args.get('indicator', '今日')
                 if indicator not in ('今日', '5日', '10日'):
@@ -565,7 +603,6 @@ class TrendingServer:
                 return jsonify({'error': 'Data not found'}), 404
             
             try:
-                import json
                 with open(data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 response = jsonify(data)
@@ -578,6 +615,12 @@ class TrendingServer:
                 self.logger.error(f"读取数据失败: {e}")
                 return jsonify({'error': str(e)}), 500
 
+        def _data_response(body: bytes) -> Response:
+            """由缓存的 JSON 字节构建新的响应对象（允许跨域访问）"""
+            response = app.response_class(body, mimetype=app.json.mimetype)
+            response.headers.add('Access-Control-Allow-Origin', '*')
+            return response
+
         @app.route('/api/data')
         def api_data_by_date():
             """按日期获取数据 API
@@ -587,9 +630,6 @@ class TrendingServer:
                 - start_date: 开始日期 (YYYY-MM-DD)
                 - end_date: 结束日期 (YYYY-MM-DD)
             """
-            from datetime import datetime
-            from src.db import TrendingDAO
-            from src.config import DATABASE
             
             # 获取日期参数
             date_param = request.args.get('date')
@@ -630,6 +670,13 @@ class TrendingServer:
             else:
                 date_range_str = f"{start_date.isoformat()} to {end_date.isoformat()}"
             
+            # 缓存检查（30s TTL，刷新数据源后清除）；缓存序列化后的 JSON 字节，
+            # 每个请求构建独立的 Response，避免跨线程共享同一可变响应对象
+            cache_key = f"data:{start_date.isoformat()}:{end_date.isoformat()}"
+            cached = _api_cache.get(cache_key)
+            if cached is not None:
+                return _data_response(cached)
+            
             try:
                 # 从数据库获取数据
                 dao = TrendingDAO(DATABASE['path'])
@@ -643,7 +690,7 @@ class TrendingServer:
                 
                 # 如果没有数据，返回友好提示
                 if not items:
-                    return jsonify({
+                    body = jsonify({
                         'success': True,
                         'data': {
                             'date': date_range_str,
@@ -654,7 +701,9 @@ class TrendingServer:
                             'total_items': 0,
                             'message': f'No data available for {date_range_str}'
                         }
-                    })
+                    }).get_data()
+                    _api_cache.set(cache_key, body, ttl=30)
+                    return _data_response(body)
                 
                 # 按数据源分组，并按热度排序
                 sources = {}
@@ -702,9 +751,9 @@ class TrendingServer:
                     }
                 }
                 
-                response = jsonify(response_data)
-                response.headers.add('Access-Control-Allow-Origin', '*')
-                return response
+                body = jsonify(response_data).get_data()
+                _api_cache.set(cache_key, body, ttl=30)
+                return _data_response(body)
                 
             except Exception as e:
                 self.logger.error(f"获取日期数据失败: {e}")
@@ -719,8 +768,6 @@ class TrendingServer:
                 - source: 数据源筛选（可选）
                 - limit: 返回数量（默认 50，最大 200）
             """
-            from src.db import TrendingDAO
-            from src.config import DATABASE
 
             query = request.args.get('q', '').strip()
             source = request.args.get('source')
@@ -790,17 +837,16 @@ class TrendingServer:
                 self.logger.info(f"收到刷新数据源请求: {source}")
                 
                 # 验证数据源是否有效
-                valid_sources = ['github', 'github_ai', 'bilibili', 'arxiv', 
-                               'hackernews', 'zhihu', 'weibo', 'douyin', 'aihot']
-                if source not in valid_sources:
+                if source not in REFRESHABLE_SOURCES:
                     return jsonify({
                         'success': False, 
-                        'message': f'未知的数据源: {source}. 有效的数据源: {", ".join(valid_sources)}'
+                        'message': f'未知的数据源: {source}. 有效的数据源: {", ".join(REFRESHABLE_SOURCES)}'
                     }), 400
                 
                 # 创建临时调度器来执行刷新
                 scheduler = TrendingTaskScheduler(logger=self.logger)
                 result = scheduler.refresh_data([source])
+                _api_cache.clear_prefix('data:')
                 
                 self.logger.info(f"数据源 {source} 刷新完成")
                 
@@ -827,9 +873,17 @@ class TrendingServer:
                 
                 self.logger.info("收到刷新所有数据源请求")
                 
-                # 创建临时调度器来执行刷新
-                scheduler = TrendingTaskScheduler(logger=self.logger)
-                result = scheduler.refresh_data()
+                # 已有全量刷新在进行时直接等待其结果，不重复提交
+                with self._refresh_lock:
+                    future = self._refresh_future
+                    if future is None or future.done():
+                        future = self._refresh_future = self._refresh_pool.submit(
+                            lambda: TrendingTaskScheduler(logger=self.logger).refresh_data()
+                        )
+                    else:
+                        self.logger.info("全量刷新进行中，等待当前任务完成")
+                result = future.result()
+                _api_cache.clear_prefix('data:')
                 
                 self.logger.info("所有数据源刷新完成")
                 
@@ -971,8 +1025,9 @@ class TrendingServer:
                 host=self.host,
                 port=self.port,
                 debug=False,
-                threaded=True,
-                use_reloader=False  # 禁用重载器，避免与线程冲突
+                threaded=True,  # keep-alive 需要多线程模式，否则一个连接会阻塞其他请求
+                use_reloader=False,  # 禁用重载器，避免与线程冲突
+                request_handler=KeepAliveRequestHandler
             )
         except Exception as e:
             self.logger.error(f"服务器运行错误: {e}")
@@ -992,6 +1047,7 @@ class TrendingServer:
         
         self.running = False
         self.config_watcher.stop()
+        self._refresh_pool.shutdown(wait=False)
         self.logger.info("✅ HTTP 服务器已停止")
 
     def is_running(self) -> bool:
@@ -0,0 +1,79 @@
+"""
+TopicCluster 测试（小语料 Jaccard 合并与哈希模式的关键词）
+
+运行: python -m unittest discover -s tests
+"""
+
+import unittest
+
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from src.analytics.clustering import TopicCluster, _EN_STOP, _ZH_STOP
+from src.db import TrendingItem
+
+
+STOP_WORDS = ENGLISH_STOP_WORDS | _EN_STOP | _ZH_STOP
+
+
+def _items(titles):
+    return [TrendingItem(source='hackernews', title=title, url=f"https://example.com/{i}")
+            for i, title in enumerate(titles)]
+
+
+def _title_groups(topics):
+    return sorted(sorted(item.title for item in topic.items) for topic in topics)
+
+
+class TinyClusterTest(unittest.TestCase):
+
+    def assertNoStopWords(self, topics):
+        for topic in topics:
+            self.assertTrue(topic.keywords)
+            self.assertFalse(set(topic.keywords) & STOP_WORDS, topic.keywords)
+
+    def test_unrelated_titles_are_not_merged(self):
+        titles = [
+            'How to write a parser in Rust',
+            'A guide to the GPU market in 2026',
+            'Is it time to move off Kubernetes? It looks like it',
+            'Notes on the history of Unix',
+            'Show HN: a tiny database in Python',
+        ]
+        topics = TopicCluster(n_clusters=3).cluster(_items(titles))
+
+        self.assertEqual(_title_groups(topics), sorted([title] for title in titles))
+        self.assertNoStopWords(topics)
+
+    def test_related_titles_are_merged(self):
+        titles = [
+            'Rust parser combinators tutorial',
+            'Writing a fast parser in Rust',
+            'GPU market prices fall',
+            'GPU shortage hits the market',
+            'Notes on the history of Unix',
+        ]
+        topics = TopicCluster(n_clusters=3).cluster(_items(titles))
+
+        self.assertEqual(_title_groups(topics), [
+            ['GPU market prices fall', 'GPU shortage hits the market'],
+            ['Notes on the history of Unix'],
+            ['Rust parser combinators tutorial', 'Writing a fast parser in Rust'],
+        ])
+        self.assertNoStopWords(topics)
+
+
+class HashingKeywordsTest(unittest.TestCase):
+
+    def test_keywords_exclude_stop_words(self):
+        titles = [f"{subject} is on the rise in {year}"
+                  for subject in ('Rust', 'GPU', 'Unix', 'Python')
+                  for year in range(2020, 2024)]
+        topics = TopicCluster(n_clusters=4, use_hashing=True).cluster(_items(titles))
+
+        self.assertTrue(topics)
+        for topic in topics:
+            self.assertFalse(set(topic.keywords) & STOP_WORDS, topic.keywords)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+FetchFailureDAO 测试（基于临时 SQLite 数据库文件）
+
+运行: python -m unittest discover -s tests
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.db import Database, FetchFailureDAO, FailureStatus
+
+
+class FetchFailureDAOTestCase(unittest.TestCase):
+    """为每个测试创建独立的临时数据库"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / 'failures.db'
+
+    def tearDown(self):
+        Database.close_thread_connections()
+        self._tmp.cleanup()
+
+    def pending_rows(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute('''
+                SELECT id, source, retry_count FROM fetch_failures
+                WHERE status = 'pending' ORDER BY id
+            ''').fetchall()
+        finally:
+            conn.close()
+
+
+class SaveFailureTest(FetchFailureDAOTestCase):
+
+    def test_upsert_keeps_one_pending_row_per_source(self):
+        dao = FetchFailureDAO(self.db_path)
+        first_id = dao.save_failure('github', 'timeout', retry_count=1)
+        second_id = dao.save_failure('github', 'HTTP 502', retry_count=2)
+        other_id = dao.save_failure('zhihu', '401', retry_count=1)
+
+        self.assertEqual(first_id, second_id)
+        self.assertNotEqual(first_id, other_id)
+        self.assertEqual(self.pending_rows(), [(first_id, 'github', 2), (other_id, 'zhihu', 1)])
+        self.assertEqual(dao.get_by_source('github').error_message, 'HTTP 502')
+
+    def test_new_pending_row_after_success(self):
+        dao = FetchFailureDAO(self.db_path)
+        first_id = dao.save_failure('github', 'timeout')
+        self.assertTrue(dao.mark_success('github'))
+
+        second_id = dao.save_failure('github', 'timeout again')
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(self.pending_rows(), [(second_id, 'github', 0)])
+
+
+class MarkSuccessBatchTest(FetchFailureDAOTestCase):
+
+    def test_marks_only_pending_rows_of_given_sources(self):
+        dao = FetchFailureDAO(self.db_path)
+        for source in ('github', 'zhihu', 'weibo'):
+            dao.save_failure(source, 'error')
+
+        self.assertEqual(dao.mark_success_batch(['github', 'zhihu', 'unknown']), 2)
+        self.assertEqual(dao.mark_success_batch([]), 0)
+        self.assertEqual([row[1] for row in self.pending_rows()], ['weibo'])
+        self.assertEqual(dao.get_by_source('github').status, FailureStatus.SUCCESS)
+        self.assertEqual(dao.get_by_source('weibo').status, FailureStatus.PENDING)
+
+
+class PendingIndexMigrationTest(FetchFailureDAOTestCase):
+
+    def test_duplicate_pending_rows_are_pruned_to_latest(self):
+        # 旧版本表结构没有待重试唯一索引，可能存在同一数据源的多条待重试记录
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript('''
+            CREATE TABLE fetch_failures (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source VARCHAR(50) NOT NULL,
+                error_message TEXT,
+                retry_count INTEGER DEFAULT 0,
+                last_try_at TIMESTAMP,
+                next_retry_at TIMESTAMP,
+                status VARCHAR(20) DEFAULT 'pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO fetch_failures (source, retry_count, status) VALUES
+                ('github', 1, 'pending'),
+                ('github', 2, 'pending'),
+                ('github', 3, 'pending'),
+                ('github', 0, 'success'),
+                ('zhihu', 1, 'pending');
+        ''')
+        conn.close()
+
+        dao = FetchFailureDAO(self.db_path)
+
+        self.assertEqual(self.pending_rows(), [(3, 'github', 3), (5, 'zhihu', 1)])
+        self.assertEqual(len(dao.get_all_failures(status='success')), 1)
+        # 迁移后 upsert 命中保留下来的记录
+        self.assertEqual(dao.save_failure('github', 'again', retry_count=4), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""
+TrendingDAO 测试（基于临时 SQLite 数据库文件）
+
+运行: python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import random
+import sqlite3
+import tempfile
+import unittest
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from src.db import Database, TrendingDAO, TrendingItem
+from src.db.models import json_dumps
+
+
+def _reference_save_items(db_path: Path, items) -> int:
+    """批量化之前的逐条 save_items 实现（逐条查重后 UPDATE / INSERT，冲突时跳过该条）"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    saved_count = 0
+    updated_count = 0
+    try:
+        for item in items:
+            fetched_at = item.fetched_at or datetime.now()
+            fetched_date = fetched_at.date().isoformat()
+            values = (
+                item.category,
+                item.url,
+                item.author,
+                item.description,
+                item.hot_score,
+                ','.join(item.keywords) if item.keywords else '',
+                json_dumps(item.extra) if item.extra else '{}',
+                fetched_at,
+            )
+            try:
+                existing = conn.execute('''
+                    SELECT id FROM trending_items
+                    WHERE source = ? AND title = ? AND fetched_date = ?
+                ''', (item.source, item.title, fetched_date)).fetchone()
+                if existing:
+                    conn.execute('''
+                        UPDATE trending_items SET
+                            category = ?, url = ?, author = ?, description = ?,
+                            hot_score = ?, keywords = ?, extra = ?, fetched_at = ?
+                        WHERE id = ?
+                    ''', (*values, existing['id']))
+                    updated_count += 1
+                else:
+                    conn.execute('''
+                        INSERT INTO trending_items
+                        (source, title, category, url, author, description, hot_score, keywords, extra, fetched_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (item.source, item.title, *values))
+                    saved_count += 1
+                conn.commit()
+            except sqlite3.IntegrityError:
+                conn.rollback()
+    finally:
+        conn.close()
+    return saved_count + updated_count
+
+
+def _stored_rows(db_path: Path):
+    """读取表中全部热点数据（排序后比较）"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted(conn.execute('''
+            SELECT source, title, url, hot_score, keywords, extra, fetched_at
+            FROM trending_items
+        ''').fetchall())
+    finally:
+        conn.close()
+
+
+class TrendingDAOTestCase(unittest.TestCase):
+    """为每个测试创建独立的临时数据库"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        self.dao = TrendingDAO(self.tmp_dir / 'trending.db')
+
+    def tearDown(self):
+        Database.close_thread_connections()
+        self._tmp.cleanup()
+
+    def save(self, dao, items) -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return dao.save_items(items)
+
+
+class SaveItemsTest(TrendingDAOTestCase):
+
+    def _random_batch(self, rng, base, n):
+        items = []
+        for i in range(n):
+            title = f"title {rng.randint(0, 15)}"
+            items.append(TrendingItem(
+                source=rng.choice(['github', 'zhihu']),
+                title=title,
+                url=f"https://example.com/{title}",  # 同一标题对应固定链接
+                hot_score=rng.random() * 100,
+                keywords=rng.sample(['AI', '芯片', 'Rust'], 2),
+                extra={'rank': i} if i % 2 else {},
+                fetched_at=base + timedelta(days=rng.randint(0, 1), hours=rng.randint(0, 3)),
+            ))
+        return items
+
+    def test_matches_per_item_reference(self):
+        rng = random.Random(1)
+        base = datetime(2026, 10, 1, 8)
+        for trial in range(20):
+            batches = [self._random_batch(rng, base, rng.randint(1, 40)) for _ in range(3)]
+            batched_path = self.tmp_dir / f'batched_{trial}.db'
+            reference_path = self.tmp_dir / f'reference_{trial}.db'
+            batched = TrendingDAO(batched_path)
+            TrendingDAO(reference_path)  # 只用于建表
+
+            with self.subTest(trial=trial):
+                batched_counts = [self.save(batched, batch) for batch in batches]
+                reference_counts = [_reference_save_items(reference_path, batch) for batch in batches]
+                self.assertEqual(batched_counts, reference_counts)
+                self.assertEqual(_stored_rows(batched_path), _stored_rows(reference_path))
+
+    def test_url_conflict_is_skipped(self):
+        now = datetime(2026, 10, 1, 8)
+        items = [
+            TrendingItem(source='github', title='first', url='https://example.com/x', fetched_at=now),
+            TrendingItem(source='github', title='second', url='https://example.com/x', fetched_at=now),
+        ]
+        self.assertEqual(self.save(self.dao, items), 1)
+        self.assertEqual([row[1] for row in _stored_rows(self.dao.db.db_path)], ['first'])
+
+    def test_items_without_title_or_url_are_skipped(self):
+        items = [
+            TrendingItem(source='github', title='', url='https://example.com/a'),
+            TrendingItem(source='github', title='no url', url=''),
+            TrendingItem(source='github', title='ok', url='https://example.com/ok'),
+        ]
+        self.assertEqual(self.save(self.dao, items), 1)
+        self.assertEqual(self.dao.get_count(), 1)
+
+
+class AggregationQueryTest(TrendingDAOTestCase):
+
+    def setUp(self):
+        super().setUp()
+        rng = random.Random(2)
+        now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        words = ['AI', ' 芯片', 'Rust ', '大模型', 'open source', '']
+        self.items = [
+            TrendingItem(
+                source=rng.choice(['github', 'zhihu', 'weibo']),
+                title=f"item {i}",
+                url=f"https://example.com/{i}",
+                keywords=rng.sample(words, rng.randint(0, 3)),
+                fetched_at=now - timedelta(days=rng.randint(0, 12), hours=rng.randint(0, 6)),
+            )
+            for i in range(300)
+        ]
+        self.save(self.dao, self.items)
+
+    def test_trending_keywords_match_python_counting(self):
+        days = 7
+        start = date.today() - timedelta(days=days)
+        expected = Counter(
+            kw.strip()
+            for item in self.items if item.fetched_at.date() >= start
+            for kw in ','.join(item.keywords).split(',') if kw.strip()
+        )
+
+        result = self.dao.get_trending_keywords(days=days, top_n=100)
+        self.assertEqual({row['keyword']: row['count'] for row in result}, dict(expected))
+
+        counts = [row['count'] for row in result]
+        self.assertEqual(counts, sorted(counts, reverse=True))
+
+        top = self.dao.get_trending_keywords(days=days, top_n=2)
+        self.assertEqual([row['count'] for row in top], [c for _, c in expected.most_common(2)])
+
+    def test_daily_counts_match_python_counting(self):
+        end = date.today()
+        start = end - timedelta(days=7)
+        in_range = [item for item in self.items if start <= item.fetched_at.date() <= end]
+
+        expected = Counter(item.fetched_at.date() for item in in_range)
+        self.assertEqual(self.dao.get_daily_counts(start, end), sorted(expected.items()))
+
+        expected_github = Counter(item.fetched_at.date() for item in in_range if item.source == 'github')
+        self.assertEqual(self.dao.get_daily_counts(start, end, source='github'),
+                         sorted(expected_github.items()))
+
+        by_source = defaultdict(Counter)
+        for item in in_range:
+            by_source[item.source][item.fetched_at.date()] += 1
+        self.assertEqual(self.dao.get_counts_by_source_and_day(start, end),
+                         {source: dict(counter) for source, counter in by_source.items()})
+
+    def test_items_by_keywords_match_get_items(self):
+        start = date.today() - timedelta(days=5)
+        keywords = ['item 1', 'ITEM 2', '%', '_', 'missing']
+        result = self.dao.get_items_by_keywords(keywords, start_date=start, limit_per_keyword=7)
+        for kw in keywords:
+            with self.subTest(keyword=kw):
+                expected = self.dao.get_items(keyword=kw, start_date=start, limit=7)
+                self.assertEqual([item.id for item in result[kw]], [item.id for item in expected])
+        self.assertEqual(result['%'], [])
+        self.assertEqual(result['_'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()